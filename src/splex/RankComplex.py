@@ -1,17 +1,42 @@
 
 import numbers
 import numpy as np 
+from math import comb
 
 from .meta import *
-from combin import comb_to_rank, rank_to_comb
+from .combinatorial import rank_comb, rank_combs, unrank_combs, rank_dtype, facet_ranks, rank_locator, rank_keys, to_wide, WIDE_RANK
+from .storage import save_array, load_array
+from .views import FaceView
 from .generics import *
 from .predicates import *
 from .Simplex import *
 # from ..Complex import *
 from more_itertools import unique_everseen
 from collections import Counter
+from itertools import combinations, groupby
+from bisect import bisect_left, bisect_right
 from .complex_abcs import Complex
 
+def _unique_sorted(x: np.ndarray) -> np.ndarray:
+  """Sorts and deduplicates a 1-d array of ranks; faster than np.unique for large integer arrays."""
+  if x.dtype == WIDE_RANK and not np.any(x['hi']): ## sorting the low words natively is much faster than sorting 16-byte keys
+    return to_wide(_unique_sorted(x['lo'].astype(np.uint64)))
+  y = np.sort(rank_keys(x))
+  return (y[np.r_[True, y[1:] != y[:-1]]] if len(y) > 0 else y).view(x.dtype)
+
+def _searchsorted(a: np.ndarray, v: np.ndarray, step: int = 64) -> np.ndarray:
+  """Equivalent to _np.searchsorted(a, v)_ for a sorted strided view _a_ (e.g. a field), without making a contiguous copy of it.
+  
+  Each value is first located between every _step_-th element of _a_, then within that window by comparison, which is 
+  cheaper than copying _a_ whenever there are few values relative to the length of _a_. Opaque keys (see _rank_keys_) do 
+  not support the comparison, so are always searched with _np.searchsorted_.
+  """
+  if a.flags.c_contiguous or len(v)*step > len(a) or a.dtype.kind == 'V':
+    return np.searchsorted(a, v)
+  w = np.maximum(np.searchsorted(a[::step], v) - 1, 0) * step
+  P = w[:,np.newaxis] + np.arange(step)
+  return w + np.sum((a[np.minimum(P, len(a)-1)] < v[:,np.newaxis]) & (P < len(a)), axis=1)
+
 class RankComplex(Complex, Sequence, ComplexLike):
   """Simplicial complex represented via the combinatorial number system.
   
@@ -20,77 +45,232 @@ class RankComplex(Complex, Sequence, ComplexLike):
   integer in the range [0, comb(n,p+1)).
 
   Computationally, the simplices and their dimensions are stored via ranks as 64-bit/8-bit unsigned integers, respectively, in a structured numpy array.
-  When needed, their vertex representations are computed on the fly by inverting the correspondence ('unranking'). This process can be prone to overflow due to the 
-  growth rate of the binomial coefficient---however, for low-dimensional complexes it is fairly safe. In particular, if the vertex labels 
-  always start from 0, then any _d_-dimensional complex of with _n_ unique vertex labels will be representable without overflow if: 
-
-  - _d_ <= 0 and _n_ <= 2**64 - 1
-  - _d_ <= 1 and _n_ <= ~ 6B 
-  - _d_ <= 2 and _n_ <= ~ 4.5M 
-  - _d_ <= 3 and _n_ <= ~ 125K
-  - _d_ <= 4 and _n_ <= ~ 15K
+  When needed, their vertex representations are computed on the fly by inverting the correspondence ('unranking'). Due to the 
+  growth rate of the binomial coefficient, 64-bit ranks can overflow. In particular, if the vertex labels 
+  always start from 0, then any _d_-dimensional complex of with _n_ unique vertex labels will be representable in 63 bits if: 
+
+  - _d_ <= 0 and _n_ <= 2**63
+  - _d_ <= 1 and _n_ <= ~ 4.2B 
+  - _d_ <= 2 and _n_ <= ~ 3.8M 
+  - _d_ <= 3 and _n_ <= ~ 110K
+  - _d_ <= 4 and _n_ <= ~ 13K
   ...
   
-  The smallest _n_ that causes overflow for complete complexes is 68, and thus this data structure should be avoided when very 
-  high-dimensional complexes are needed. 
+  Beyond these limits, the complex automatically switches to a _wide_ mode wherein the ranks are stored as 128-bit integers, i.e. 
+  as pairs of big-endian 64-bit words (see _WIDE_RANK_). The API, the vectorized O(log n) lookups, and memory-mapped loading are 
+  unchanged, and only the dimensions whose ranks actually exceed 63 bits are ranked and unranked with exact arbitrary-precision 
+  arithmetic; the cost is the larger (17 byte) records.
 
   Attributes:
-    simplices: structured ndarray of dtype [('rank', uint64), ('dim', uint8)] containing the simplex ranks and dimensions, respectively. 
+    simplices: structured ndarray of dtype [('rank', uint64), ('dim', uint8)] containing the simplex ranks and dimensions, respectively
+      ('rank' has dtype _WIDE_RANK_ in wide mode). 
+    offsets: array delimiting each dimension in _simplices_, which is sorted by (dim, rank).
   """
   
   @staticmethod 
   def _str_rank(item: SimplexConvertible) -> tuple:
     s = Simplex(item)
-    return comb_to_rank(s), dim(s)
+    return rank_comb(s), dim(s)
+
+  @staticmethod
+  def _face_ranks(F: np.ndarray, wide: bool = False) -> dict:
+    """Ranks every face of the rows of a dense (m, k) array of simplices in bulk.
+
+    Rows with repeated vertex labels are collapsed to their unique vertices, as with _Simplex_. If _wide_ is True, 
+    the ranks are returned as _WIDE_RANK_ words. 
+
+    Returns:
+      dictionary mapping each dimension p to the sorted, unique colex ranks of the p-faces of _F_. 
+    """
+    F = np.sort(np.atleast_2d(F), axis=1)
+    m, k = F.shape
+    n = int(np.max(F)) + 1
+    dup = F[:,1:] == F[:,:-1]
+    n_unique = k - np.sum(dup, axis=1)
+    ranks = {}
+    for u in np.unique(n_unique):
+      in_group = n_unique == u
+      V = F[in_group]
+      if u < k: ## collapse repeated labels; each row keeps exactly u entries
+        keep = np.c_[np.ones(len(V), dtype=bool), ~dup[in_group]]
+        V = V[keep].reshape(-1, u)
+      for p in range(u):
+        idx = np.array(list(combinations(range(u), p+1)))
+        P = np.array(V[:,idx].reshape(-1, p+1), order='C')
+        P_ranks = rank_combs(P, n, order='colex', wide=wide)
+        ranks.setdefault(p, []).append(P_ranks if wide else P_ranks.astype(np.uint64))
+    return { p : _unique_sorted(np.concatenate(r, dtype=r[0].dtype)) for p, r in sorted(ranks.items()) }
+
+  @classmethod
+  def from_array(cls, F: ArrayLike) -> 'RankComplex':
+    """Constructs a rank complex from a dense array of simplices.
+
+    Each row of the given (m, k) integer array _F_ is treated as a simplex, whose faces are enumerated via column 
+    combinations, ranked in a single vectorized call per dimension, and then deduplicated via _np.unique_. 
+
+    Parameters:
+      F: (m, k) array of non-negative integer vertex labels. 
+
+    Returns:
+      rank complex containing the rows of _F_ and all of their faces. 
+    """
+    F = np.asarray(F)
+    assert F.ndim == 2 and (F.size == 0 or np.issubdtype(F.dtype, np.integer)), "Input must be a 2-d array of integer labels."
+    if not (F.size == 0 or F.min() >= 0):
+      raise ValueError("Vertex labels must be non-negative integers.")
+    K = cls()
+    K.update(F)
+    return K
 
   def __init__(self, simplices: Iterable[SimplexConvertible] = None) -> None:
     """"""
     # assert isinstance(simplices, Iterable) and is_repeatable(simplices), "Iterable must be repeatable. A generator is not sufficient!"
     # simplices = faces(simplices) if isinstance(simplices, ComplexLike) else simplices 
     self.s_dtype = np.dtype([('rank', np.uint64), ('dim', np.uint8)])
+    self.simplices = np.empty(dtype=self.s_dtype, shape=(0,))
+    self._stars = {}
+    self._index()
     if simplices is not None:
-      simplices = list(map(Simplex, simplices))
-      sset = unique_everseen(faces(simplices))
-      self.simplices = np.unique(np.array([RankComplex._str_rank(s) for s in sset], dtype=self.s_dtype))
-    else:
-      self.simplices = np.empty(dtype=self.s_dtype, shape=(0,0))
+      self.update(simplices)
+
+  def _index(self) -> None:
+    """Recomputes the offsets delimiting each dimension in the (dim, rank)-sorted simplices array.
+    
+    The ranks of the p-simplices are stored contiguously in _simplices[offsets[p]:offsets[p+1]]_.
+    """
+    d = int(self.simplices['dim'][-1]) if len(self.simplices) > 0 else -1
+    self.offsets = np.searchsorted(self.simplices['dim'], np.arange(d+2))
+
+  def _ranks(self, p: int) -> np.ndarray:
+    """Returns the sorted ranks of the p-simplices in the complex."""
+    if p < 0 or p >= len(self.offsets) - 1:
+      return np.empty(0, dtype=self.s_dtype['rank'])
+    return self.simplices['rank'][self.offsets[p]:self.offsets[p+1]]
+
+  def _n(self) -> int:
+    """Returns the largest vertex label in the complex plus one."""
+    if self.dim() < 0:
+      return 0
+    r = self.simplices['rank'][self.offsets[1]-1]
+    return int(r['lo'] if self.wide else r) + 1
+
+  @property
+  def wide(self) -> bool:
+    """Whether the ranks are stored as 128-bit integers to prevent overflow."""
+    return self.s_dtype['rank'] == WIDE_RANK
+
+  def _widen(self, n: int, k: int) -> None:
+    """Switches to 128-bit rank storage if (k-1)-simplices on _n_ vertices can overflow 64-bit ranks."""
+    if not self.wide and rank_dtype(n, k) == WIDE_RANK:
+      self.s_dtype = np.dtype([('rank', WIDE_RANK), ('dim', np.uint8)])
+      simplices = np.empty(len(self.simplices), dtype=self.s_dtype)
+      simplices['rank'], simplices['dim'] = to_wide(self.simplices['rank']), self.simplices['dim']
+      self.simplices = simplices
+      self._stars = {}
+
+  def _unrank(self, ranks: np.ndarray, k: int) -> np.ndarray:
+    """Unranks colex ranks of (k-1)-simplices of this complex into an array of their vertex labels."""
+    return unrank_combs(ranks, k=k, n=self._n(), order='colex')
+
+  def _unrank_records(self, simplices: np.ndarray) -> Iterator[np.ndarray]:
+    """Unranks a structured array of (rank, dim) records, one run of equal dimension at a time."""
+    breaks = np.flatnonzero(np.diff(simplices['dim'].astype(np.int16))) + 1
+    for run in np.split(simplices, breaks):
+      if len(run) > 0:
+        yield from self._unrank(run['rank'], k=int(run['dim'][0])+1)
 
   def __len__(self) -> int: 
     return len(self.simplices)
-  
-  def __contains__(self, x: SimplexConvertible) -> bool:
-    return comb_to_rank(x) in self.simplices['rank']
-    
+
+  def __contains__(self, item: SimplexConvertible) -> bool:
+    """Simplex membership check, via binary search over the ranks of simplices of the same dimension."""
+    if len(item) == 0: 
+      return True # always contains the empty face
+    r, p = RankComplex._str_rank(item)
+    if p >= len(self.offsets) - 1:
+      return False
+    ## bisect on the strided field view directly, as np.searchsorted would copy it
+    ranks, lo, hi = self.simplices['rank'], self.offsets[p], self.offsets[p+1]
+    if self.wide: ## bisect the high words, then the low words amongst those equal 
+      lo, hi = bisect_left(ranks['hi'], r >> 64, lo=lo, hi=hi), bisect_right(ranks['hi'], r >> 64, lo=lo, hi=hi)
+      ranks, r = ranks['lo'], r & (2**64 - 1)
+    i = bisect_left(ranks, r, lo=lo, hi=hi)
+    return bool(i < hi and ranks[i] == r)
+
+  def contains_many(self, simplices: ArrayLike) -> np.ndarray:
+    """Vectorized simplex membership check.
+
+    Parameters:
+      simplices: (m, p+1) array of p-simplices. A 1-d array is interpreted as an array of vertices.
+
+    Returns:
+      boolean array of length m indicating which simplices are in the complex. 
+    """
+    S = np.array(simplices, copy=True)
+    S = S[:,np.newaxis] if S.ndim == 1 else S
+    assert S.ndim == 2, "Simplices must be given as a 2-d array."
+    if len(S) == 0: 
+      return np.empty(0, dtype=bool)
+    S.sort(axis=1)
+    ranks = self._ranks(S.shape[1]-1)
+    valid = np.all(S[:,1:] != S[:,:-1], axis=1) & (S[:,0] >= 0) & (S[:,-1] < self._n()) ## rows w/ repeated or unknown labels are not p-simplices
+    found = np.zeros(len(S), dtype=bool)
+    if len(ranks) == 0 or not np.any(valid):
+      return found
+    r = rank_combs(S[valid], self._n(), order='colex', wide=self.wide)
+    ranks, r = rank_keys(ranks), rank_keys(r if self.wide else r.astype(np.uint64))
+    ind = np.minimum(np.searchsorted(ranks, r), len(ranks)-1)
+    found[valid] = ranks[ind] == r
+    return found
+
   def dim(self) -> int: 
     """The maximal dimension of any simplex in the complex."""
-    return np.max(self.simplices['dim'])
+    return len(self.offsets) - 2
 
-  def faces(self, p: int = None, **kwargs) -> Iterable['SimplexLike']:
+  def faces(self, p: int = None, **kwargs) -> FaceView:
     """Enumerates the faces of the complex.
     
     Parameters:
       p: optional integer indicating which dimension of faces to enumerate. Default to None (enumerates all faces).
     
     Returns:
-      generator which yields on evaluation yields the simplex
+      a _FaceView_ over the ranks of the faces, unranked on demand. For fixed _p_, _np.asarray_ yields the dense (m, p+1) array of faces.
     """
-    if p is not None: ## Returns a simplexWrapper
+    if p is not None:
       assert isinstance(p, numbers.Integral)
-      p_ranks = self.simplices['rank'][self.simplices['dim'] == p]
-      return rank_to_comb(p_ranks, k=p+1, order='colex') if len(p_ranks) > 0 else np.empty(shape=(0,), dtype=np.int64)
+      return FaceView.from_ranks(self._ranks(p), k=p+1, n=self._n())
     else:
-      return map(Simplex, rank_to_comb(self.simplices['rank'], k=self.simplices['dim']+1, order='colex'))
+      return FaceView.from_ranks(self.simplices['rank'], k=self.simplices['dim'].astype(np.int64)+1, n=self._n())
 
   def card(self, p: int = None) -> Union[tuple, int]:
     if p is None: 
-      # return tuple(Counter(self.simplices['dim']).values())
-      return tuple(np.bincount(self.simplices['dim']))
+      return tuple(np.diff(self.offsets))
     else: 
-      return np.sum(self.simplices['dim'] == p)
+      return len(self._ranks(p))
+
+  def _boundary_chunks(self, p: int, chunk_size: Optional[int] = None) -> Iterator[tuple]:
+    """Yields the row indices, column indices, and signs of the nonzero entries of the p-th boundary matrix, _chunk_size_ columns at a time.
+
+    Rows and columns index the (p-1)- and p-simplices in rank order, respectively. The facets of the p-simplices are 
+    ranked directly from their vertex block and located in the sorted (p-1)-ranks with a _rank_locator_.
+    """
+    R, F, k = self._ranks(p), self._ranks(p-1), p+1
+    if p <= 0 or len(R) == 0:
+      return
+    locate, step = rank_locator(F), len(R) if chunk_size is None else int(chunk_size)
+    for lo in range(0, len(R), step):
+      C = R[lo:lo+step]
+      I = locate(facet_ranks(self._unrank(C, k), n=self._n(), order='colex')[:,::-1].ravel()) ## i-th column omits the (k-1-i)-th label
+      assert np.all(I >= 0), "Complex is missing faces of some of its simplices."
+      yield I, lo + np.repeat(np.arange(len(C)), k), np.tile((-1)**np.arange(k, dtype=np.int8), len(C))
+
+  def _boundary_entries(self, p: int) -> tuple:
+    """Returns the row indices, column indices, and signs of the nonzero entries of the p-th boundary matrix (see _boundary_chunks_)."""
+    return next(self._boundary_chunks(p), (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)))
 
   def __iter__(self) -> Iterable[SimplexLike]:
     """Enumerates the faces of the complex."""
-    yield from rank_to_comb(self.simplices['rank'], k=self.simplices['dim']+1, order='colex')
+    yield from self._unrank_records(self.simplices)
 
   def __getitem__(self, index: Union[int, slice]) -> Union[SimplexConvertible, Iterable]:
     """Retrieves a simplex at some index position. 
@@ -98,71 +278,157 @@ class RankComplex(Complex, Sequence, ComplexLike):
     Note this constructs the simplex on demand from its rank information. 
     """
     if isinstance(index, Integral):
-      s = rank_to_comb(self.simplices['rank'][index], k=self.simplices['dim'][index]+1, order='colex')
+      s = next(self._unrank_records(self.simplices[[index]]))
       return Simplex(s)
     elif isinstance(index, slice):
-      return map(Simplex, rank_to_comb(self.simplices['rank'][index], k=self.simplices['dim'][index]+1, order='colex'))
+      return self.faces()[index]
     else:
       raise ValueError(f"Invalid index type '{type(index)}' given.")
 
-  def add(self, item: SimplexConvertible) -> None: ## TODO: consider array module with numpy array fcasting 
+  def update(self, simplices: Union[Iterable[SimplexConvertible], ArrayLike]) -> None:
+    """Adds simplices and their faces to the complex in bulk.
+
+    The faces of all the given simplices are ranked and deduplicated first; the ranks not already in the complex 
+    are then merged into each dimension's sorted block in a single linear pass. 
+
+    Parameters:
+      simplices: Iterable of simplices, or a dense (m, k) array of integer vertex labels. 
+    """
+    if isinstance(simplices, np.ndarray) and simplices.ndim == 2 and np.issubdtype(simplices.dtype, np.integer):
+      groups = [simplices] if simplices.size > 0 else []
+    else:
+      by_size = sorted(filter(len, map(Simplex, simplices)), key=len)
+      groups = [np.array([s.vertices for s in group]) for k, group in groupby(by_size, key=len)]
+    if len(groups) == 0:
+      return
+    if any(F.min() < 0 for F in groups):
+      raise ValueError("Vertex labels must be non-negative integers.")
+    self._widen(max(self._n(), *[int(np.max(F))+1 for F in groups]), max(self.dim()+1, *[F.shape[1] for F in groups]))
+    face_ranks = {}
+    for F in groups:
+      for p, r in RankComplex._face_ranks(F, wide=self.wide).items():
+        face_ranks.setdefault(p, []).append(r)
+    face_ranks = { p : _unique_sorted(np.concatenate(r, dtype=r[0].dtype)) for p, r in face_ranks.items() }
+    
+    ## Merge the new ranks into the existing sorted blocks
+    d, n_new = max(self.dim(), max(face_ranks, default=-1)), 0
+    blocks = []
+    for p in range(d+1):
+      old, new = np.ascontiguousarray(self._ranks(p)), face_ranks.get(p, np.empty(0, dtype=self.s_dtype['rank']))
+      old_keys, new_keys = rank_keys(old), rank_keys(new)
+      ind = np.searchsorted(old_keys, new_keys)
+      is_new = ind == len(old)
+      is_new[~is_new] = old_keys[ind[~is_new]] != new_keys[~is_new]
+      blocks.append(np.insert(old, ind[is_new], new[is_new]))
+      n_new += np.sum(is_new)
+    if n_new > 0:
+      simplices = np.empty(sum(map(len, blocks)), dtype=self.s_dtype)
+      simplices['rank'] = np.concatenate(blocks)
+      simplices['dim'] = np.repeat(np.arange(d+1), list(map(len, blocks)))
+      self.simplices = simplices
+      self._stars = {}
+      self._index()
+
+  def add(self, item: SimplexConvertible) -> None:
     """Adds a simplex and its faces to the complex, if they do not already exist.
     
     If _item_ is already in the complex, the underlying complex is not modified. 
     """
-    if item not in self:
-      face_ranks = np.array([RankComplex._str_rank(f) for f in faces(item)], dtype=self.s_dtype)
-      self.simplices = np.unique(np.append(self.simplices, face_ranks))
-    # new_faces = []
-    # for s in simplices:
-    #   face_ranks = [RankComplex._str_rank(f) for f in faces(s)]
-    #   new_faces.extend(face_ranks)
-    # new_faces = np.array(new_faces, dtype=self.s_dtype)
-    # self.simplices = np.unique(np.append(self.simplices, new_faces))
-
-  def cofaces(self, item: SimplexConvertible):
-    s = Simplex(item)
-    yield from filter(lambda t: Simplex(t) >= s, iter(self))
+    self.update([item])
+
+  def _star_index(self, q: int) -> tuple:
+    """Returns the vertex-simplex incidences of the q-simplices, as arrays of vertex labels and ranks sorted by (vertex, rank).
+    
+    The incidences are built on first use, and kept until simplices are added. Removing simplices leaves stale incidences 
+    behind, which _coface_mask_ skips by checking the ranks it finds against the current ranks.
+    """
+    if q not in self._stars:
+      R = self._ranks(q)
+      V = self._unrank(R, k=q+1).ravel()
+      V = V.astype(np.uint32) if self._n() <= 2**32 else V
+      o = np.argsort(V, kind='stable') ## the ranks are sorted, so a stable sort by vertex sorts by (vertex, rank)
+      self._stars[q] = (V[o], np.repeat(R, q+1)[o])
+    return self._stars[q]
+
+  def _coface_mask(self, item: SimplexConvertible) -> np.ndarray:
+    """Boolean mask over the _simplices_ array indicating the cofaces of _item_.
+    
+    The candidate q-cofaces are the q-simplices incident to the vertex of _item_ with the fewest of them, read from a 
+    sorted (vertex, rank) incidence array (see _star_index_) with a binary search. Only the candidates are unranked and 
+    tested for containing _item_, so the cost is proportional to the size of the star rather than of the complex.
+    """
+    s = np.array(Simplex(item).vertices, dtype=np.int64)
+    mask = np.zeros(len(self.simplices), dtype=bool)
+    if len(s) == 0: 
+      mask[:] = True
+      return mask
+    if s[0] < 0 or s[-1] >= self._n():
+      return mask
+    for q in range(len(s)-1, self.dim()+1):
+      V, R = self._star_index(q)
+      sv = s.astype(V.dtype) ## matching dtypes, as np.searchsorted would otherwise cast (i.e. copy) V
+      lo, hi = np.searchsorted(V, sv, side='left'), np.searchsorted(V, sv, side='right')
+      i = np.argmin(hi - lo)
+      ranks, cand = self._ranks(q), R[lo[i]:hi[i]]
+      if len(cand) == 0 or len(ranks) == 0:
+        continue
+      keys, cand = rank_keys(ranks), rank_keys(cand)
+      j = np.minimum(_searchsorted(keys, cand), len(ranks)-1)
+      j = j[keys[j] == cand] ## skip the incidences of removed simplices
+      if len(s) > 1 and len(j) > 0:
+        j = j[np.sum(np.isin(self._unrank(ranks[j], k=q+1), s), axis=1) == len(s)]
+      mask[self.offsets[q] + j] = True
+    return mask
+
+  def cofaces(self, item: SimplexConvertible) -> Iterator[Simplex]:
+    """Enumerates the cofaces of a given simplex, i.e. its star, in (dim, rank) order."""
+    mask = self._coface_mask(item)
+    for q in range(self.dim()+1):
+      q_ranks = self._ranks(q)[mask[self.offsets[q]:self.offsets[q+1]]]
+      if len(q_ranks) > 0:
+        yield from map(Simplex, self._unrank(q_ranks, k=q+1))
 
-  ## TODO: need to add cofaces to enable remove 
-  ## TODO: distinguish simplex convertible from Iterable of simplices--need to revisit the predicates
   def remove(self, item: SimplexConvertible) -> None:
-    """Removes simplices from the complex. They must exist.
+    """Removes a simplex and all of its cofaces from the complex. The simplex must exist.
 
-    If any of the supplied _simplices_ are not in the complex, raise a KeyError.
+    If the supplied simplex is not in the complex, raise a KeyError.
     """
-    s_item = np.array([RankComplex._str_rank(item)], dtype=self.s_dtype)
-    if s_item not in self.simplices:
+    if item not in self:
       raise KeyError(f"{str(item)} not in complex.")
-    s_cofaces = np.array([RankComplex._str_rank(item) for f in self.cofaces(item)], dtype=self.s_dtype)
-    self.simplices = np.setdiff1d(self.simplices, s_cofaces)
-    # faces_to_remove = np.array([(rank_colex(s), dim(s)) for s in simplices], dtype=self.s_dtype)
-    # in_complex = np.array([s in self.simplices for s in faces_to_remove])
-    # if any(~in_complex):
-    #   bad = list(simplices)[np.flatnonzero(~in_complex)[0]]
-    #   raise KeyError(f"{bad} not in complex.")
-    # self.simplices = np.setdiff1d(self.simplices, faces_to_remove)
+    self.discard(item)
 
   def discard(self, item: SimplexConvertible) -> None:
-    """Removes simplices from the complex, if they exist.
+    """Removes a simplex and all of its cofaces from the complex, if they exist.
     
-    If none of the supplied _simplices_ are in the complex, the simplices are not modified.  
+    If the supplied simplex is not in the complex, the complex is not modified. Since removal preserves 
+    the (dim, rank) order, the star is dropped with a single boolean mask. 
     """
-    s_cofaces = np.array([RankComplex._str_rank(f) for f in self.cofaces(item)], dtype=self.s_dtype)
-    if len(s_cofaces) > 0:
-      self.simplices = np.setdiff1d(self.simplices, s_cofaces)
+    mask = self._coface_mask(item)
+    if np.any(mask):
+      ## compressing opaque fixed-width records is several times faster than compressing structured ones
+      S = self.simplices
+      self.simplices = np.asarray(S).view(np.dtype((np.void, S.dtype.itemsize)))[~mask].view(S.dtype)
+      self._index()
 
-  def __contains__(self, item: SimplexConvertible) -> bool:
-    # s = Simplex(item)
-    if len(item) == 0: 
-      return True # always contains the empty face
-    s = np.array([RankComplex._str_rank(item)], self.s_dtype)
-    return self.simplices.__contains__(s)
-    # return self.data.__contains__()
+  def save(self, path: str) -> None:
+    """Saves the complex to _path_ in a binary format that _load_ can memory-map."""
+    save_array(path, self.simplices, kind=type(self).__name__, order='colex', n=self._n())
+
+  @classmethod
+  def load(cls, path: str, mmap_mode: Optional[str] = 'r') -> 'RankComplex':
+    """Loads a complex written by _save_. 
+    
+    The stored ranks are used as-is, without re-ranking or re-sorting. By default the complex is backed by a 
+    read-only _np.memmap_; pass _mmap_mode=None_ to read it into memory instead. 
+    """
+    simplices, header = load_array(path, mmap_mode)
+    if header.get('kind') != cls.__name__:
+      raise ValueError(f"File '{path}' does not contain a {cls.__name__}.")
+    K = cls()
+    K.simplices, K.s_dtype = simplices, simplices.dtype
+    K._index()
+    return K
 
-  def __len__(self) -> int: 
-    return len(self.simplices)
-  
   def __repr__(self) -> str:
     if len(self) == 0:
       return "< Empty rank complex >"
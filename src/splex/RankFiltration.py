@@ -3,48 +3,184 @@ import numbers
 import numpy as np
 
 from operator import itemgetter
-from combin import comb_to_rank, rank_to_comb
+from bisect import bisect_left, bisect_right
+from .combinatorial import rank_comb, rank_combs, unrank_combs, min_rank_dtype, facet_ranks, locate_ranks, rank_locator
+from .combinatorial import rank_keys, rank_words, to_wide, WIDE_RANK
+from .storage import save_array, load_array, ColumnArray
+from .views import FaceView
 
 from .meta import *
 from .generics import SimplexConvertible
 from .RankComplex import RankComplex
-from .predicates import is_complex_like
+from .predicates import is_complex_like, is_simplex_like
 from .generics import faces
 from .Simplex import Simplex
 from .filter_abcs import Filtration
 DEBUG = {}
 
+def _storage_dtype(n: int, k_max: int, value_dtype: np.dtype = np.float64) -> np.dtype:
+  """Returns the most compact (rank, dim, value) record dtype for simplices of size at most _k_max_ on _n_ vertices."""
+  return np.dtype([('rank', min_rank_dtype(n, k_max)), ('dim', np.uint8), ('value', value_dtype)])
+
+def _order_bits(x: np.ndarray) -> np.ndarray:
+  """Maps numbers to unsigned 64-bit integers with the same ordering."""
+  x = np.asarray(x)
+  if np.issubdtype(x.dtype, np.floating):
+    b = (x.astype(np.float64) + 0.0).view(np.uint64) ## adding zero maps -0.0 to +0.0
+    return np.where(b >> np.uint64(63), ~b, b | np.uint64(1 << 63))
+  elif np.issubdtype(x.dtype, np.signedinteger):
+    return x.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+  return x.astype(np.uint64)
+
+def _lexsort_records(records: np.ndarray, reverse: bool = False) -> np.ndarray:
+  """Returns the permutation sorting (value, dim, rank) records into filtration order, with descending ranks if _reverse_."""
+  words = tuple(~w if reverse else w for w in rank_words(records['rank']))
+  return np.lexsort(words + (records['dim'], records['value']))
+
+def _sort_keys(records: np.ndarray, reverse: bool = False) -> np.ndarray:
+  """Packs (value, dim, rank) records into fixed-width byte strings which compare in filtration order."""
+  wide = records.dtype['rank'] == WIDE_RANK
+  keys = np.empty(len(records), dtype=[('value', '>u8'), ('dim', 'u1'), ('rank', WIDE_RANK if wide else '>u8')])
+  keys['value'], keys['dim'] = _order_bits(records['value']), records['dim']
+  if wide:
+    R = records['rank']
+    keys['rank']['hi'], keys['rank']['lo'] = (~R['hi'], ~R['lo']) if reverse else (R['hi'], R['lo'])
+  else:
+    keys['rank'] = ~records['rank'].astype(np.uint64) if reverse else records['rank']
+  return keys.view(np.dtype((np.void, keys.dtype.itemsize)))
+
+def _merge_sorted(A: np.ndarray, B: np.ndarray, reverse: bool = False) -> np.ndarray:
+  """Merges two record arrays, each sorted in filtration order, into one sorted array."""
+  if len(A) == 0 or len(B) == 0:
+    return np.concatenate([A, B], dtype=A.dtype) ## an explicit dtype keeps the byte order of wide ranks
+  return np.insert(A, np.searchsorted(_sort_keys(A, reverse), _sort_keys(B, reverse)), B)
+
 class RankFiltration(Filtration):
-  def __init__(self, simplices: Union[ComplexLike, Iterable], f: Callable = None, value_dtype = np.float64):
-    s_dtype= np.dtype([('rank', np.int64), ('dim', np.uint16), ('value', value_dtype)])
+  """Filtered complex of simplices represented via the combinatorial number system.
+
+  The simplices are stored by their ranks, dimensions, and filter values in a structured numpy array, sorted in filtration order. 
+  Ranks use the narrowest unsigned integer type that can hold the rank of any simplex on the same vertices of at most the same 
+  dimension, and dimensions are stored as bytes. If the simplices are numerous enough to overflow 63-bit ranks, the ranks are instead 
+  stored as 128-bit integers (see _WIDE_RANK_); see _RankComplex_ for details.
+
+  With _layout='columns'_, the records are instead stored as separate contiguous arrays (see _ColumnArray_), which speeds up 
+  sorting and other per-field operations at no cost in memory.
+
+  Attributes:
+    simplices: structured array (or _ColumnArray_) of (rank, dim, value) records in filtration order.
+    n_simplices: number of simplices of each dimension.
+    offsets: starting position of each dimension's simplices when grouped by dimension, i.e. the cumulative sum of _n_simplices_.
+  """
+  def __init__(self, simplices: Union[ComplexLike, Iterable], f: Callable = None, value_dtype = np.float64, layout: str = 'records'):
     if is_complex_like(simplices):
       if isinstance(f, Callable):
-        self.simplices = np.array([(comb_to_rank(s), len(s)-1, f(s)) for s in simplices], dtype=s_dtype)
+        pairs = [(f(s), Simplex(s)) for s in simplices]
       else:
         raise ValueError("Must supply filter function 'f' for ComplexLike inputs.")
     elif isinstance(simplices, Iterable):
       if isinstance(f, Callable):
-        self.simplices = np.array([(comb_to_rank(s), len(s)-1, f(s)) for s in simplices], dtype=s_dtype)
+        pairs = [(f(s), Simplex(s)) for s in simplices]
       else:
         global DEBUG 
         # DEBUG['s_dtype'] = s_dtype
         # DEBUG['simplices'] = list(simplices)
-        self.simplices = np.array([(comb_to_rank(s), len(s)-1, np.ravel(k).item()) for k, s in simplices], dtype=s_dtype)
+        pairs = [(np.ravel(k).item(), Simplex(s)) for k, s in simplices]
     elif simplices is None:
       # Allow default constructible for empty filtrations
-      self.simplices = np.empty(shape=(0,), dtype=s_dtype)
+      pairs = []
     else: 
       error_msg = "Invalid input; if filter 'f' is supplied, 'simplices' must be an iterable of simplex-like objects\n" 
       error_msg += "Otherwise, 'simplices' should be an iterable of pairs"
       raise ValueError(error_msg)
+    n = max((s[-1] for k, s in pairs if len(s) > 0), default=-1) + 1
+    k_max = max((len(s) for k, s in pairs), default=0)
+    assert layout in ['records', 'columns'], f"Invalid layout '{layout}' given."
+    s_dtype = _storage_dtype(n, k_max, value_dtype)
+    words = (lambda r: (r >> 64, r & (2**64 - 1))) if s_dtype['rank'] == WIDE_RANK else (lambda r: r)
+    records = np.array([(words(rank_comb(s)), len(s)-1, k) for k, s in pairs], dtype=s_dtype)
+    self.simplices = ColumnArray.from_records(records) if layout == 'columns' else records
     self._order = 'colex'
+    self._index(n)
     self.reindex()
+
+  @classmethod
+  def from_arrays(cls, blocks: Mapping[int, Union[ArrayLike, tuple]], f: Callable = None, value_dtype = np.float64, layout: str = 'records') -> 'RankFiltration':
+    """Constructs a filtration from per-dimension blocks of simplices and their filter values.
+
+    Each block is ranked with a single vectorized call, and the filtration order is established with a single sort. 
+    Like the pair-based constructor, the blocks are assumed to be closed under taking faces and to contain no duplicates.
+
+    Parameters:
+      blocks: mapping p -> (S, v) of (m, p+1) integer arrays _S_ of p-simplices with their values _v_, or p -> S if _f_ is supplied. 
+      f: optional vectorized filter function, evaluated once per (m, p+1) block. 
+      value_dtype: dtype to store the filter values as. 
+      layout: either 'records' (a structured array) or 'columns' (a struct of arrays). 
+    """
+    S_blocks, V_blocks = {}, {}
+    for p, block in blocks.items():
+      if f is None and not isinstance(block, tuple):
+        raise ValueError(f"Block of dimension {p} must be an (S, v) pair if no filter function 'f' is supplied.")
+      S, v = (block, None) if f is not None else block
+      S_blocks[p] = np.sort(np.reshape(np.asarray(S, dtype=np.int64), (-1, p+1)), axis=1)
+      V_blocks[p] = np.ravel(f(S_blocks[p]) if f is not None else v)
+      assert len(V_blocks[p]) == len(S_blocks[p]), f"Number of values for dimension {p} must match the number of {p}-simplices"
+    n = max((int(S.max()) + 1 for S in S_blocks.values() if S.size > 0), default=0)
+    k_max = max((p+1 for p, S in S_blocks.items() if len(S) > 0), default=0)
+    s_dtype, m = _storage_dtype(n, k_max, value_dtype), sum(len(S) for S in S_blocks.values())
+    F = cls(None, value_dtype=value_dtype, layout=layout)
+    F.simplices = ColumnArray.empty(m, s_dtype) if layout == 'columns' else np.empty(m, dtype=s_dtype)
+    i = 0
+    for p, S in sorted(S_blocks.items()):
+      block = F.simplices[i:i+len(S)]
+      block['rank'] = rank_combs(S, n=n, order='colex', wide=s_dtype['rank'] == WIDE_RANK)
+      block['dim'], block['value'] = p, V_blocks[p]
+      i += len(S)
+    F._index(n)
+    F.reindex()
+    return F
+
+  def _index(self, n: Optional[int] = None, n_simplices: Optional[tuple] = None) -> None:
+    """Caches the vertex count and the per-dimension counts and offsets of the simplices."""
+    if n_simplices is None:
+      n_simplices = np.bincount(self.simplices['dim']) if len(self.simplices) > 0 else []
+    if n is None:
+      v_ranks = self.simplices['rank'][self.simplices['dim'] == 0]
+      v_ranks = v_ranks['lo'] if v_ranks.dtype == WIDE_RANK else v_ranks
+      n = int(np.max(v_ranks)) + 1 if len(v_ranks) > 0 else 0
+    self.n_simplices = tuple(int(c) for c in n_simplices)
+    self.offsets = np.cumsum([0] + list(self.n_simplices), dtype=np.int64)
+    self.n_vertices = int(n)
+    self._dim_order = None
+
+  def _dim_index(self) -> tuple:
+    """Returns the permutation sorting the simplices by (dim, rank), along with the correspondingly sorted ranks.
+    
+    The permutation is built on first use and discarded whenever the filtration order changes.
+    """
+    if self._dim_order is None:
+      perm = np.lexsort(rank_words(self.simplices['rank']) + (self.simplices['dim'],))
+      self._dim_order = (perm, np.ascontiguousarray(self.simplices['rank'][perm]))
+    return self._dim_order
+
+  def _n(self) -> int:
+    """Returns the largest vertex label in the filtration plus one."""
+    return self.n_vertices
+
+  @property
+  def wide(self) -> bool:
+    """Whether the ranks are stored as 128-bit integers to prevent overflow."""
+    return self.simplices.dtype['rank'] == WIDE_RANK
     
   def comb_to_rank(self, combs, **kwargs):
     assert 'order' not in kwargs, "Order is fixed by the filtration"
     order = 'colex' if 'co' in self.order else 'lex'
-    n = np.max(self.simplices['rank'][self.simplices['dim'] == 0]) + 1
-    return comb_to_rank(combs, order=order, n=n, **kwargs)
+    n = self._n()
+    if isinstance(combs, np.ndarray) and combs.ndim == 2:
+      return rank_combs(np.sort(combs, axis=1), n=n, order=order, wide=self.wide)
+    elif is_simplex_like(combs):
+      return rank_comb(Simplex(combs), n=n, order=order)
+    R = [rank_comb(Simplex(c), n=n, order=order) for c in combs]
+    return to_wide(R) if self.wide else np.array(R, dtype=self.simplices.dtype['rank'])
 
   @property
   def order(self):
@@ -56,16 +192,22 @@ class RankFiltration(Filtration):
     order = 'colex' if 'co' in value else 'lex'
     stored_colex, request_colex = 'co' in self._order, 'co' in value
     if stored_colex != request_colex:
-      n = int(np.max(self.simplices['rank'][self.simplices['dim'] == 0])) + 1
-      self.simplices['rank'] = np.array([comb_to_rank(s, order=order, n = n) for i,s in iter(self)], dtype=np.int64) 
+      ## Re-rank each dimension in bulk: unrank the block in the stored order, then rank it in the requested order
+      n, stored = self._n(), 'colex' if stored_colex else 'lex'
+      ranks = np.empty_like(self.simplices['rank'])
+      for p in range(len(self.n_simplices)):
+        p_ind = np.flatnonzero(self.simplices['dim'] == p)
+        C = unrank_combs(self.simplices['rank'][p_ind], k=p+1, n=n, order=stored)
+        ranks[p_ind] = rank_combs(np.sort(C, axis=1), n=n, order=order, wide=self.wide)
+      self._replace_field('rank', ranks)
+      self._dim_order = None
     self._order = value
     self.reindex()
 
   def __iter__(self) -> Iterable:
     """Enumerates the faces of the complex."""
     order = 'colex' if 'co' in self.order else 'lex'
-    n = np.max(self.simplices['rank'][self.simplices['dim'] == 0]) + 1
-    simplices = rank_to_comb(self.simplices['rank'], k=self.simplices['dim']+1, n = n, order=order)
+    simplices = unrank_combs(self.simplices['rank'], k=self.simplices['dim']+1, n=self._n(), order=order)
     # yield from zip(self.simplices['value'], simplices)
     return zip(self.simplices['value'], simplices)
 
@@ -73,46 +215,316 @@ class RankFiltration(Filtration):
     return len(self.simplices)
 
   def __contains__(self, k: SimplexConvertible) -> bool:
-    order = 'colex' if 'co' in self.order else 'lex'
-    s = np.array(Simplex(k))
-    n = np.max(self.simplices['rank'][self.simplices['dim'] == 0]) + 1
-    r = comb_to_rank(s, order=order, n=n)
-    ind = np.flatnonzero(self.simplices['rank'] == r)
-    return (len(k)-1) in self.simplices['dim'][ind]
+    return self.index(k) >= 0
+
+  def index(self, item: SimplexConvertible) -> int:
+    """Returns the position of a simplex in filtration order, or -1 if it's not in the filtration.
+    
+    Uses a single binary search over the ranks of simplices of the same dimension.
+    """
+    s = Simplex(item)
+    p = len(s) - 1
+    if p < 0 or p >= len(self.n_simplices) or s[-1] >= self._n():
+      return -1
+    perm, ranks = self._dim_index()
+    r = rank_comb(s, n=self._n(), order='colex' if 'co' in self.order else 'lex')
+    if self.wide:
+      ranks, r = rank_keys(ranks), rank_keys(to_wide([r]))[0]
+    lo, hi = self.offsets[p], self.offsets[p+1]
+    j = lo + np.searchsorted(ranks[lo:hi], r)
+    return int(perm[j]) if j < hi and ranks[j] == r else -1
+
+  def index_many(self, simplices: Union[ArrayLike, Iterable[SimplexConvertible]]) -> np.ndarray:
+    """Returns the positions of many simplices in filtration order, with -1 marking those not in the filtration.
+    
+    Simplices may be given as an (m, p+1) array, or as an iterable of simplices of possibly different dimensions. 
+    Each dimension is ranked with a single vectorized call and located with a single _searchsorted_ call.
+    """
+    if isinstance(simplices, np.ndarray) and simplices.ndim == 2:
+      groups = [(np.arange(len(simplices)), simplices)]
+    else:
+      simplices = [tuple(s) for s in simplices]
+      lengths = np.array([len(s) for s in simplices], dtype=np.int64)
+      groups = [(ind, np.array([simplices[i] for i in ind], dtype=np.int64).reshape(len(ind), k)) for k in np.unique(lengths) for ind in [np.flatnonzero(lengths == k)]]
+    out = np.full(sum(len(ind) for ind, C in groups), -1, dtype=np.int64)
+    n, order = self._n(), 'colex' if 'co' in self.order else 'lex'
+    for ind, C in groups:
+      p = C.shape[1] - 1
+      if p < 0 or p >= len(self.n_simplices) or len(C) == 0:
+        continue
+      C = np.sort(C, axis=1)
+      valid = np.flatnonzero((C[:,0] >= 0) & (C[:,-1] < n) & np.all(np.diff(C, axis=1) > 0, axis=1))
+      out[ind[valid]] = self._locate_ranks(p, rank_combs(C[valid], n=n, order=order, wide=self.wide))
+    return out
+
+  def _locate_ranks(self, p: int, R: np.ndarray, ranks: Optional[np.ndarray] = None) -> np.ndarray:
+    """Returns the positions in filtration order of the p-simplices with ranks _R_, with -1 marking those not in the filtration.
+    
+    If given, _ranks_ replaces the stored ranks arranged in (dim, rank) order, e.g. to search ranks taken with respect to more vertices.
+    """
+    out = np.full(len(R), -1, dtype=np.int64)
+    if p < 0 or p >= len(self.n_simplices):
+      return out
+    perm, stored_ranks = self._dim_index()
+    ranks = stored_ranks if ranks is None else ranks
+    lo, hi = self.offsets[p], self.offsets[p+1]
+    j = locate_ranks(ranks[lo:hi], R)
+    found = j >= 0
+    out[found] = perm[lo + j[found]]
+    return out
   
   ## --- Sequence requirements ---
   def __getitem__(self, key: Any) -> Simplex: 
     order = 'colex' if 'co' in self.order else 'lex'
-    s = rank_to_comb(self.simplices['rank'][key], k=self.simplices['dim'][key]+1, order=order)
+    if isinstance(key, Integral):
+      s = unrank_combs(self.simplices['rank'][[key]], k=int(self.simplices['dim'][key])+1, n=self._n(), order=order)[0]
+      return self.simplices['value'][key], tuple(map(int, s))
+    s = unrank_combs(self.simplices['rank'][key], k=self.simplices['dim'][key]+1, n=self._n(), order=order)
     return self.simplices['value'][key], s
 
+  def _tie_order(self) -> np.ndarray:
+    """Returns the permutation sorting the simplices by dimension, then by rank (descending for the reverse orders)."""
+    perm, _ = self._dim_index()
+    if 'reverse' in self.order:
+      perm = np.concatenate([perm[:0]] + [perm[lo:hi][::-1] for lo, hi in zip(self.offsets[:-1], self.offsets[1:])])
+    return perm
+
+  def _permute(self, ind: np.ndarray) -> None:
+    """Rearranges the simplices into the order given by _ind_, carrying the (dim, rank) index along with them."""
+    S = self.simplices
+    if isinstance(S, ColumnArray):
+      self.simplices = S[ind]
+    else: ## gathering opaque fixed-width records is several times faster than gathering structured ones
+      self.simplices = np.asarray(S).view(np.dtype((np.void, S.dtype.itemsize)))[ind].view(S.dtype)
+    if self._dim_order is not None:
+      new_pos = np.empty(len(ind), dtype=np.int64)
+      new_pos[ind] = np.arange(len(ind))
+      self._dim_order = (new_pos[self._dim_order[0]], self._dim_order[1])
+
+  def _replace_field(self, name: str, values: np.ndarray) -> None:
+    """Replaces a field of the simplices with _values_.
+    
+    The records are copied rather than written in place, as they may be shared with views (see _sublevel_) or backed by a 
+    read-only or on-disk mapping (see _load_).
+    """
+    if isinstance(self.simplices, ColumnArray):
+      columns = dict(self.simplices.columns)
+      columns[name] = np.array(values, dtype=columns[name].dtype)
+      self.simplices = ColumnArray(columns)
+    else:
+      simplices = np.array(self.simplices)
+      simplices[name] = values
+      self.simplices = simplices
+
   def reindex(self, f: Callable['SimplexLike', Any] = None) -> None:
+    """Sorts the simplices into filtration order, optionally re-evaluating their values with the filter function _f_.
+    
+    Since ties in value are broken by (dim, rank), the sort uses a single stable sort of the values arranged in (dim, rank) order.
+    """
     if f is not None:
       assert isinstance(f, Callable), "f must be a callable filter function"
-      self.simplices['value'] = f(faces(self))
-    if 'reverse' in self.order:
-      np.negative(self.simplices['rank'], self.simplices['rank'])
-    ind = np.argsort(self.simplices, order=('value', 'dim', 'rank'))
-    if 'reverse' in self.order:
-      np.negative(self.simplices['rank'], self.simplices['rank'])
-    self.simplices = self.simplices[ind]
+      self._replace_field('value', f(faces(self)))
+    tie = self._tie_order()
+    self._permute(tie[np.argsort(self.simplices['value'][tie], kind='stable')])
+
+  def update_values(self, simplices: Union[ArrayLike, Iterable[SimplexConvertible]], values: ArrayLike) -> None:
+    """Changes the values of some simplices, restoring filtration order by merging rather than re-sorting.
+
+    The updated simplices are sorted amongst themselves and located in the remaining (already sorted) simplices with a single 
+    _searchsorted_ over their values, with ties broken by their packed sort keys (see _merge_), then inserted in one pass. Updates touching a large fraction of 
+    the simplices fall back to a full _reindex_, which is faster in that case.
+
+    Parameters:
+      simplices: 1-d integer array of positions in filtration order, or the simplices themselves (see _index_many_).
+      values: new values of the given simplices, or a single value to assign to all of them.
+    """
+    keys = np.asarray(simplices) if isinstance(simplices, np.ndarray) else None
+    if keys is not None and keys.ndim == 1 and np.issubdtype(keys.dtype, np.integer):
+      ind = np.where(keys < 0, keys + len(self), keys).astype(np.int64)
+      assert np.all((ind >= 0) & (ind < len(self))), "Positions out of range"
+    else:
+      ind = self.index_many(simplices)
+      if np.any(ind < 0):
+        raise KeyError("Cannot update the values of simplices not in the filtration.")
+    assert len(np.unique(ind)) == len(ind), "Simplices to update must be distinct"
+    values = np.broadcast_to(np.asarray(values, dtype=self.simplices.dtype['value']), ind.shape)
+    if len(ind) > len(self) // 8:
+      new_values = np.array(self.simplices['value'])
+      new_values[ind] = values
+      self._replace_field('value', new_values)
+      self.reindex()
+      return
+
+    ## Sort the updated simplices, then locate them in the remaining simplices (which stay sorted) by value
+    reverse = 'reverse' in self.order
+    mask = np.ones(len(self), dtype=bool)
+    mask[ind] = False
+    rest = np.flatnonzero(mask)
+    moved = self.simplices[ind]
+    moved['value'] = values
+    o = _lexsort_records(moved, reverse)
+    moved, ind, values = moved[o], ind[o], values[o]
+    rest_values = self.simplices['value'][rest]
+    pos, hi = np.searchsorted(rest_values, values, side='left'), np.searchsorted(rest_values, values, side='right')
+    
+    ## Break ties in value by (dim, rank), comparing packed sort keys over the span of tied simplices only
+    tied = np.flatnonzero(hi > pos)
+    if len(tied) > 0:
+      a, b = pos[tied].min(), hi[tied].max()
+      pos[tied] = a + np.searchsorted(_sort_keys(self.simplices[rest[a:b]], reverse), _sort_keys(moved[tied], reverse))
+    self._permute(np.insert(rest, pos, ind))
+    self.simplices['value'][pos + np.arange(len(pos))] = values ## permuting copied the records, so views are unaffected
+
+  def _view(self, lo: int, hi: int) -> 'RankFiltration':
+    """Returns a read-only filtration over the simplices at positions [lo, hi), sharing memory with this filtration.
+
+    Since the methods modifying a filtration replace its records rather than write into them, views are unaffected by later 
+    changes to this filtration.
+    """
+    F = type(self)(None, value_dtype=self.simplices.dtype['value'])
+    F.simplices, F._order = self.simplices[lo:hi], self._order
+    F.simplices.setflags(write=False)
+    F._index(self.n_vertices, np.bincount(F.simplices['dim']) if hi > lo else [])
+    return F
+
+  def sublevel(self, t: Any) -> 'RankFiltration':
+    """Returns the sublevel set of simplices with value at most _t_, as a view sharing memory with this filtration.
+
+    Since faces never appear after their cofaces, the sublevel set is itself a filtration. The view is read-only and keeps the
+    vertex count of this filtration, so it may be used with all the usual generics (e.g. _faces_, _card_, _boundary_matrix_).
+    """
+    return self._view(0, bisect_right(self.simplices['value'], t))
+
+  def between(self, a: Any, b: Any) -> 'RankFiltration':
+    """Returns the simplices with values in the closed interval [a, b], as a view sharing memory with this filtration.
+
+    Unlike _sublevel_, the result need not be closed under taking faces, in which case its boundary matrices are undefined and 
+    _boundary_matrix_ raises a ValueError. The view is read-only.
+    """
+    lo = bisect_left(self.simplices['value'], a)
+    return self._view(lo, max(lo, bisect_right(self.simplices['value'], b, lo)))
+
+  def _ranks_in(self, n: int) -> np.ndarray:
+    """Returns the ranks of the simplices with respect to _n_ vertices, which only differ from the stored ranks for the lex orders."""
+    if 'co' in self.order or n == self._n():
+      return self.simplices['rank']
+    ranks = np.empty(len(self), dtype=min_rank_dtype(n, len(self.n_simplices)))
+    for p in range(len(self.n_simplices)):
+      p_ind = np.flatnonzero(self.simplices['dim'] == p)
+      C = unrank_combs(self.simplices['rank'][p_ind], k=p+1, n=self._n(), order='lex')
+      ranks[p_ind] = rank_combs(C, n=n, order='lex', wide=ranks.dtype == WIDE_RANK)
+    return ranks
+
+  def merge(self, other: 'RankFiltration', policy: str = 'min') -> 'RankFiltration':
+    """Merges this filtration with another over a common vertex set, returning a new filtration.
+
+    Simplices appearing in both filtrations are assigned either the minimum ('min') or maximum ('max') of their two values, or 
+    the value from this filtration ('first'). Since both filtrations are already sorted, the merged order is obtained by a 
+    linear merge of their records rather than a sort, re-sorting only the shared simplices whose values change.
+    """
+    assert policy in ['min', 'max', 'first'], f"Invalid merge policy '{policy}' given."
+    if self.order != other.order:
+      raise ValueError(f"Cannot merge filtrations with different orders ('{self.order}' and '{other.order}').")
+    n, k_max = max(self._n(), other._n()), max(len(self.n_simplices), len(other.n_simplices))
+    s_dtype = _storage_dtype(n, k_max, np.result_type(self.simplices.dtype['value'], other.simplices.dtype['value']))
+    A, B = np.empty(len(self), dtype=s_dtype), np.empty(len(other), dtype=s_dtype)
+    for X, F in [(A, self), (B, other)]:
+      R = F._ranks_in(n)
+      X['rank'], X['dim'], X['value'] = to_wide(R) if s_dtype['rank'] == WIDE_RANK else R, F.simplices['dim'], F.simplices['value']
+
+    ## Locate the simplices of _other_ in this filtration, resolving the values of those in both 
+    iA, A_ranks = np.full(len(B), -1, dtype=np.int64), A['rank'][self._dim_index()[0]]
+    for p in range(len(other.n_simplices)):
+      p_ind = np.flatnonzero(B['dim'] == p)
+      iA[p_ind] = self._locate_ranks(p, B['rank'][p_ind], A_ranks)
+    shared = np.flatnonzero(iA >= 0)
+    iA = iA[shared]
+    values = { 'min': np.minimum, 'max': np.maximum, 'first': lambda a, b: a }[policy](A['value'][iA], B['value'][shared])
+    changed = values != A['value'][iA]
+    moved = A[iA[changed]]
+    moved['value'] = values[changed]
+
+    ## Merge the sorted remainders of both filtrations, along with the re-sorted shared simplices whose values changed
+    keep_A, keep_B = np.ones(len(A), dtype=bool), np.ones(len(B), dtype=bool)
+    keep_A[iA[changed]], keep_B[shared] = False, False
+    reverse = 'reverse' in self.order
+    moved = moved[_lexsort_records(moved, reverse)]
+    merged = _merge_sorted(A[keep_A], _merge_sorted(B[keep_B], moved, reverse), reverse)
+    F = type(self)(None, value_dtype=s_dtype['value'], layout='columns' if isinstance(self.simplices, ColumnArray) else 'records')
+    F.simplices = ColumnArray.from_records(merged) if isinstance(self.simplices, ColumnArray) else merged
+    F._order = self.order
+    F._index(n, np.bincount(merged['dim']) if len(merged) > 0 else [])
+    return F
+
+  def save(self, path: str) -> None:
+    """Saves the filtration to _path_ in a binary format that _load_ can memory-map."""
+    save_array(path, self.simplices, kind=type(self).__name__, order=self.order, n=self._n(), n_simplices=self.n_simplices)
+
+  @classmethod
+  def load(cls, path: str, mmap_mode: Optional[str] = 'r') -> 'RankFiltration':
+    """Loads a filtration written by _save_. 
+    
+    The stored ranks are used as-is, without re-ranking or re-sorting. By default the filtration is backed by a 
+    read-only _np.memmap_; pass _mmap_mode=None_ to read it into memory, or 'c' for a copy-on-write mapping. 
+    """
+    simplices, header = load_array(path, mmap_mode)
+    if header.get('kind') != cls.__name__:
+      raise ValueError(f"File '{path}' does not contain a {cls.__name__}.")
+    F = cls(None)
+    F.simplices, F._order = simplices, header['order']
+    F._index(header.get('n'), header.get('n_simplices'))
+    return F
 
   ## --- splex generics support --- 
   def dim(self) -> int:
-    return np.max(self.simplices['dim'])
+    return len(self.n_simplices) - 1
 
-  def faces(self, p: int = None, **kwargs) -> Iterable:
+  def faces(self, p: int = None, **kwargs) -> FaceView:
+    """Returns a _FaceView_ over the (p-)faces of the filtration, in filtration order."""
     assert isinstance(p, Integral) or p is None, f"Invalid p:{p} given"
-    simplices_map = map(itemgetter(1), iter(self))
+    order = 'colex' if 'co' in self.order else 'lex'
     if p is None:
-      return iter(simplices_map)
+      return FaceView.from_ranks(self.simplices['rank'], k=self.simplices['dim'].astype(np.int64)+1, n=self._n(), order=order)
     else:
       p_ind = self.simplices['dim'] == p
-      order = 'colex' if 'co' in self.order else 'lex'
-      if np.sum(p_ind) == 0: 
-        return np.empty(shape=(0,), dtype=np.int64)
-      return rank_to_comb(self.simplices['rank'][p_ind], k=p+1, order=order)
+      return FaceView.from_ranks(self.simplices['rank'][p_ind], k=p+1, n=self._n(), order=order)
+    
+  def _boundary_chunks(self, p: int, chunk_size: Optional[int] = None) -> Iterator[tuple]:
+    """Yields the row indices, column indices, and signs of the nonzero entries of the p-th boundary matrix, at most _chunk_size_ columns at a time.
+
+    Rows and columns index the (p-1)- and p-simplices in filtration order, respectively. The filtration is scanned in runs of 
+    _chunk_size_ simplices; the facets of the p-simplices in each run are ranked directly from their vertex block and located 
+    in the sorted (p-1)-ranks with a _rank_locator_. Besides one run, only arrays over the (p-1)-simplices are allocated.
+    """
+    if p <= 0 or p >= len(self.n_simplices):
+      return
+    order, k, n = 'colex' if 'co' in self.order else 'lex', p+1, self._n()
+    N, d, ranks = len(self.simplices), self.simplices['dim'], self.simplices['rank']
+    step = N if chunk_size is None else int(chunk_size)
     
+    ## Ranks of the (p-1)-simplices in filtration order, and the permutation sorting them 
+    F, c = np.empty(self.n_simplices[p-1], dtype=ranks.dtype), 0
+    for i in range(0, N, step):
+      B = ranks[i:i+step][d[i:i+step] == p-1]
+      F[c:c+len(B)], c = B, c + len(B)
+    to_local = np.argsort(rank_keys(F)).astype(np.int32 if len(F) < 2**31 else np.int64) ## sorted position -> filtration position
+    locate = rank_locator(F[to_local])
+    del F
+    col = 0
+    for i in range(0, N, step):
+      R = ranks[i:i+step][d[i:i+step] == p]
+      if len(R) == 0:
+        continue
+      j = locate(facet_ranks(unrank_combs(R, k=k, n=n, order=order), n=n, order=order)[:,::-1].ravel()) ## i-th column omits the (k-1-i)-th label
+      if np.any(j < 0):
+        raise ValueError("Filtration is missing faces of some of its simplices; boundary matrices require a filtration closed under taking faces (e.g. a sublevel set).")
+      yield to_local[j].astype(np.int64), col + np.repeat(np.arange(len(R)), k), np.tile((-1)**np.arange(k, dtype=np.int8), len(R))
+      col += len(R)
+
+  def _boundary_entries(self, p: int) -> tuple:
+    """Returns the row indices, column indices, and signs of the nonzero entries of the p-th boundary matrix (see _boundary_chunks_)."""
+    return next(self._boundary_chunks(p), (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)))
+
   def indices(self, p: int = None) -> Iterable[Any]:
     if p is None:
       return self.simplices['value']
@@ -121,9 +533,9 @@ class RankFiltration(Filtration):
   
   def card(self, p: int = None) -> Union[tuple, int]:
     if p is None: 
-      return tuple(np.bincount(self.simplices['dim']))
+      return self.n_simplices
     else: 
-      return np.sum(self.simplices['dim'] == int(p))
+      return self.n_simplices[p] if 0 <= p < len(self.n_simplices) else 0
 
 #   ## Mapping interface
 #   __iter__ = lambda self: iter(self.simplices['f'])
@@ -3,6 +3,7 @@ from .meta import *
 from .generics import *
 from .Simplex import *
 from .complex_abcs import Complex
+from .views import FaceView
 from sortedcontainers import SortedSet # SortedSet is a vaid Sequence! 
 
 class SetComplex(Complex, ComplexLike):
@@ -12,6 +13,7 @@ class SetComplex(Complex, ComplexLike):
     """ Set Complex """
     self.data = SortedSet([], key=lambda s: (len(s), tuple(s), s)) # for now, just use the lex/dim/face order 
     self.n_simplices = tuple()
+    self.stars = {} # inverted index mapping each vertex to the set of simplices containing it
     if simplices is not None: 
       self.update(simplices)
   
@@ -51,13 +53,14 @@ class SetComplex(Complex, ComplexLike):
     """Returns the maximal dimension of any simplex in the complex."""
     return len(self.n_simplices) - 1
 
-  def faces(self, p: Optional[int] = None, **kwargs) -> Iterator[Simplex]:
-    """Enumerates the (p)-faces of the complex."""
+  def faces(self, p: Optional[int] = None, **kwargs) -> FaceView:
+    """Returns a _FaceView_ over the (p)-faces of the complex."""
     if p is None:
-      yield from iter(self)
+      return FaceView(self.data)
     else: 
       assert isinstance(p, Number)
-      yield from filter(lambda s: len(s) == p + 1, iter(self))
+      lo, hi = self.data.bisect_key_left((p+1,)), self.data.bisect_key_left((p+2,))
+      return FaceView(self.data, p=p, index=range(lo, hi))
 
   def card(self, p: int = None) -> tuple:
     """Cardinality of the complex.
@@ -73,9 +76,16 @@ class SetComplex(Complex, ComplexLike):
 
   # --- Additional support functions ---
   def cofaces(self, item: Collection[int]) -> Iterator[Simplex]:
-    """Enumerates the cofaces of a give simplex."""
+    """Enumerates the cofaces of a give simplex.
+    
+    The cofaces are found by intersecting the stars of the simplex's vertices, and are enumerated in the order of the complex.
+    """
     s = Simplex(item)
-    yield from filter(lambda t: t >= s, iter(self))
+    if len(s) == 0:
+      yield from iter(self)
+      return
+    stars = sorted((self.stars.get(v, set()) for v in s), key=len)
+    yield from sorted(stars[0].intersection(*stars[1:]), key=self.data.key)
 
   def update(self, simplices: Iterable[SimplexConvertible]):
     """Updates the complex by unioning with the given iterable of simplices."""
@@ -94,6 +104,8 @@ class SetComplex(Complex, ComplexLike):
       if face not in self.data:
         self.data.add(face)
         ns[dim(face)] += 1
+        for v in face:
+          self.stars.setdefault(v, set()).add(face)
     self.n_simplices = tuple(ns)
         # if len(face) > len(self.n_simplices):
         #   # self.n_simplices = tuple(list(self.n_simplices) + [1])
@@ -110,16 +122,23 @@ class SetComplex(Complex, ComplexLike):
     """
     if not self.__contains__(item):
       raise ValueError(f"Simplex {str(Simplex(item))} does not exist in the complex.")
-    self.data.difference_update(set(self.cofaces(item)))
-    self._update_n_simplices()
+    self.discard(item)
 
   def discard(self, item: SimplexConvertible):
     """Removes a simplex from the complex.
     
     Note that removing a simplex by definition with remove all of its cofaces from the complex as well.
     """
-    self.data.difference_update(set(self.cofaces(item)))
-    self._update_n_simplices()
+    s_cofaces = set(self.cofaces(item))
+    self.data.difference_update(s_cofaces)
+    ns = np.array(self.n_simplices, dtype=np.uint64)
+    for t in s_cofaces:
+      ns[dim(t)] -= 1
+      for v in t:
+        self.stars[v].discard(t)
+        if len(self.stars[v]) == 0:
+          del self.stars[v]
+    self.n_simplices = tuple(ns[:np.max(np.flatnonzero(ns), initial=-1)+1])
   
   def _update_n_simplices(self) -> None:
     """ Bulk update to shape """
@@ -4,6 +4,8 @@ from .generics import *
 from .Simplex import *
 from .complex_abcs import * 
 from .filter_abcs import Filtration, MutableFiltration
+from .views import FaceView
+from itertools import combinations
 from sortedcontainers import SortedSet
 from more_itertools import spy, pairwise
 
@@ -40,6 +42,16 @@ class SetFiltration(MutableFiltration):
     else:
       return SortedSet(None, key)
   
+  @classmethod
+  def _copy_sorted_set(cls, S: SortedSet) -> SortedSet:
+    """Returns a copy of a sorted set, reusing its stored sort keys rather than recomputing them."""
+    T = SortedSet(key=S.key)
+    T._set.update(S._set)
+    L, M = T._list, S._list
+    L._lists, L._keys, L._maxes = [l[:] for l in M._lists], [k[:] for k in M._keys], M._maxes[:]
+    L._len, L._load = M._len, M._load
+    return T
+  
   def __init__(self, simplices: Union[ComplexLike, Iterable] = None, f: Optional[Callable] = None, order: str = 'lex') -> None:
     """Constructs a filtration by storing simplices in a _SortedSet_ container.
 
@@ -49,20 +61,18 @@ class SetFiltration(MutableFiltration):
       - Iterable[SimplexConvertible], f = Callable
     """
     self.data = SetFiltration._sorted_set()
+    self.buckets = [] # per-dimension sorted sets of simplices, each in filtration order
     self.n_simplices = tuple()
     if is_complex_like(simplices):
       if isinstance(f, Callable):
-        for s in simplices:
-          self.add(ValueSimplex(s, f(s)))
+        self.update((f(s), s) for s in simplices)
       else:
         raise ValueError("Must supply filter function 'f' for ComplexLike inputs.")
     elif isinstance(simplices, Iterable):
       if isinstance(f, Callable):
-        for s in simplices:
-          self.add(ValueSimplex(s,value=f(s)))
+        self.update((f(s), s) for s in simplices)
       else:
-        for k,s in simplices: 
-          self.add(ValueSimplex(s,value=k)) ## accept pairs, like a normal dict
+        self.update(simplices) ## accept pairs, like a normal dict
     elif simplices is None:
       pass # Allow default constructible for empty filtrations
     else: 
@@ -86,42 +96,104 @@ class SetFiltration(MutableFiltration):
   ## --- MutableSet requirements ---
   def add(self, simplex: SimplexConvertible) -> None:
     assert isinstance(simplex, SimplexConvertible) # or isinstance(simplex, tuple)
-    simplex = ValueSimplex(simplex, 0.0) if not hasattr(simplex, "value") else simplex
-    ns = list(self.n_simplices) + [0]*(dim(simplex)-self.dim())
-    for f in faces(simplex):
-      if f not in self.data:
-        self.data.add(ValueSimplex(f, simplex.value))
-        ns[dim(f)] += 1
-    self.n_simplices = tuple(ns)
+    self.update([(getattr(simplex, "value", 0.0), simplex)])
 
   def discard(self, simplex: SimplexConvertible):
     assert isinstance(simplex, SimplexConvertible) # or isinstance(simplex, tuple)
-    s_cofaces = list(self.cofaces(simplex))
+    s_cofaces = [ValueSimplex(c, value=v) for v, c in self.cofaces(simplex)]
     ns = list(self.n_simplices) 
     for c in s_cofaces:
       self.data.discard(c)
+      self.buckets[dim(c)].discard(c)
       ns[dim(c)] -= 1
     self.n_simplices = tuple([i for i in ns if i > 0])
+    del self.buckets[len(self.n_simplices):]
+
+  def _bucket(self, p: int) -> SortedSet:
+    """Returns the sorted set of p-simplices, allocating empty sets for any missing dimensions."""
+    while len(self.buckets) <= p:
+      self.buckets.append(SetFiltration._sorted_set())
+    return self.buckets[p]
 
-  # def update(self, simplices: Iterable[ValueSimplex]) -> None: 
-  #   for s in simplices: 
-  #     self.add(s)
+  def _index_buckets(self) -> None:
+    """Rebuilds the per-dimension sorted sets from the filtration's simplices."""
+    self.buckets = [SetFiltration._sorted_set() for p in range(len(self.n_simplices))]
+    for s in self.data:
+      self.buckets[len(s)-1].add(s)
+
+  def update(self, pairs: Iterable[tuple[Any, SimplexConvertible]]) -> None:
+    """Adds (value, simplex) pairs to the filtration, along with any of their faces not already present.
+
+    Faces are collected and deduplicated in a dictionary before any are inserted. Every simplex takes the minimum of its given 
+    value (the first one, if it's given more than once) and the values of the given simplices containing it. Simplices already 
+    in the filtration are left unchanged. 
+    """
+    given, induced = {}, {}
+    for v, s in pairs:
+      vertices = Simplex(s).vertices
+      if len(vertices) == 0:
+        continue
+      if vertices not in given:
+        given[vertices] = v
+      for k in range(1, len(vertices)):
+        for f in combinations(vertices, k):
+          if f not in induced or v < induced[f]:
+            induced[f] = v
+    induced.update({ f : min(v, induced.get(f, v)) for f, v in given.items() })
+    if len(self.data) > 0:
+      induced = { f : v for f, v in induced.items() if f not in self.data }
+    if len(induced) == 0:
+      return
+    new = [ValueSimplex(f, v) for f, v in induced.items()]
+    self.data.update(new)
+    by_dim = {}
+    for s in new:
+      by_dim.setdefault(len(s)-1, []).append(s)
+    for p, S in by_dim.items():
+      self._bucket(p).update(S)
+    ns = list(self.n_simplices) + [0]*(len(self.buckets)-len(self.n_simplices))
+    self.n_simplices = tuple(n + len(by_dim.get(p, ())) for p, n in enumerate(ns))
+
+  def merge(self, other: 'SetFiltration', policy: str = 'min') -> 'SetFiltration':
+    """Merges this filtration with another, returning a new filtration.
+
+    Simplices appearing in both filtrations are assigned either the minimum ('min') or maximum ('max') of their two values, or 
+    the value from this filtration ('first'). 
+    """
+    assert policy in ['min', 'max', 'first'], f"Invalid merge policy '{policy}' given."
+    resolve = { 'min': min, 'max': max, 'first': lambda a, b: a }[policy]
+    values = { Simplex(s) : s.value for s in self.data }
+    for s in other.data:
+      t = Simplex(s)
+      values[t] = resolve(values[t], s.value) if t in values else s.value
+    F = SetFiltration()
+    F.data = SetFiltration._sorted_set((ValueSimplex(s, v) for s, v in values.items()))
+    F.n_simplices = tuple(np.bincount([len(s)-1 for s in values]).tolist()) if len(values) > 0 else tuple()
+    F._index_buckets()
+    return F
 
   ## --- splex generics support --- 
   def dim(self) -> int:
     return len(self.n_simplices)-1
 
-  def faces(self, p: int = None, **kwargs) -> Iterator[ValueSimplex]:
+  def faces(self, p: int = None, **kwargs) -> FaceView:
     assert isinstance(p, Integral) or p is None, f"Invalid p:{p} given"
     #return self.values() if p is None else filter(lambda s: len(s) == p+1, self.values())
-    return iter(self.data) if p is None else filter(lambda s: len(s) == p+1, iter(self.data))
+    if p is None:
+      return FaceView(self.data)
+    return FaceView(self.buckets[p] if 0 <= p < len(self.buckets) else [], p=p)
+
+  def card(self, p: int = None) -> Union[tuple, int]:
+    if p is None: 
+      return self.n_simplices
+    return self.n_simplices[p] if 0 <= p < len(self.n_simplices) else 0
 
   ## --- Filtration specific enhancements --- 
   def indices(self, p: int = None) -> Iterator[Any]:
     if p is None: 
       return (i for i,s in iter(self))
     else: 
-      return (i for i,s in iter(self) if len(s) == p+1)
+      return (s.value for s in (self.buckets[p] if 0 <= p < len(self.buckets) else []))
 
   def reindex(self, index_set: Union[Iterable, Callable]) -> None:
     """Given a totally ordered key set of the same length of the filtation, or a callable, reindexes the simplices in the filtration"""
@@ -129,11 +201,11 @@ class SetFiltration(MutableFiltration):
       assert len(index_set) == len(self), "Index set length not match the number of simplices in the filtration!"
       assert all((i <= j for i,j in pairwise(index_set))), "Index set is not totally ordered!"
       new = SetFiltration(zip(iter(index_set), faces(self)))
-      self.data = new.data
+      self.data, self.buckets = new.data, new.buckets
       assert self.n_simplices == new.n_simplices, "Invalid reindexing; simplex counts changed"
     elif isinstance(index_set, Callable):
       new = SetFiltration(simplices=faces(self), f=index_set)
-      self.data = new.data
+      self.data, self.buckets = new.data, new.buckets
       assert self.n_simplices == new.n_simplices, "Invalid reindexing; simplex counts changed"
     else:
       raise ValueError("invalid index set supplied")
@@ -146,9 +218,9 @@ class SetFiltration(MutableFiltration):
   ## --- Miscelleneous --- 
   def copy(self) -> 'SetFiltration':
     new = SetFiltration()
-    from copy import deepcopy
-    new.data = SetFiltration._sorted_set(self.data) #deepcopy(self.data)
-    new.n_simplices = deepcopy(self.n_simplices)
+    new.data = SetFiltration._copy_sorted_set(self.data)
+    new.buckets = [SetFiltration._copy_sorted_set(b) for b in self.buckets]
+    new.n_simplices = self.n_simplices
     return new 
   
   # def _add_ns(self, ) -> None:
@@ -8,12 +8,33 @@ from more_itertools import collapse, unique_justseen, seekable, spy
 from dataclassy import dataclass
 import numpy as np 
 
+_is_int = int.__instancecheck__
+
+def _vertices(v: SimplexConvertible) -> tuple:
+  """Converts a simplex-like object into a sorted tuple of its unique vertex labels.
+
+  Tuples and lists of Python integers, integers, 1-d integer arrays, and simplices are handled directly; 
+  everything else goes through the general (nested iterable) path.
+  """
+  t = type(v)
+  if t is tuple or t is list:
+    if all(map(_is_int, v)):
+      return tuple(sorted(set(v)))
+  elif t is np.ndarray:
+    if v.ndim == 1 and v.dtype.kind in 'iu':
+      return tuple(sorted(set(v.tolist())))
+  elif isinstance(v, SimplexBase):
+    return v.vertices
+  elif isinstance(v, Integral):
+    return (v,)
+  return tuple(unique_justseen(sorted(collapse(v))))
+
 @dataclass(frozen=True, slots=True, init=False, repr=False, eq=False)
 class SimplexBase: # forget about hashable to make compatible as a data class 
   """Base class for comparable simplex-like classes with integer vertex labels."""
   vertices: Union[tuple[int], Tuple[()]] = ()
   def __init__(self, v: SimplexConvertible):
-    object.__setattr__(self, 'vertices', tuple(unique_justseen(sorted(collapse(v)))))
+    object.__setattr__(self, 'vertices', _vertices(v))
     
   def __eq__(self, other: object) -> bool: 
     if not isinstance(other, SimplexConvertible):
@@ -87,9 +108,9 @@ class SimplexBase: # forget about hashable to make compatible as a data class
   def faces(self, p: Optional[int] = None, data: bool = False, **kwargs) -> Iterator[Simplex]: 
     dim: int = len(self.vertices)
     if p is None:
-      g = map(Simplex, chain(*[combinations(self.vertices, d) for d in range(1, dim+1)]))
+      g = map(Simplex.from_sorted, chain(*[combinations(self.vertices, d) for d in range(1, dim+1)]))
     else: 
-      g = map(Simplex, combinations(self.vertices, p+1))
+      g = map(Simplex.from_sorted, combinations(self.vertices, p+1))
       # g = filter(lambda s: len(s) == p+1, self.faces()) # type: ignore
     return zip_data(g, data)
     # g = g if data == False else handle_data(g, data)
@@ -97,7 +118,7 @@ class SimplexBase: # forget about hashable to make compatible as a data class
   def boundary(self) -> Iterator[Simplex]: 
     if len(self.vertices) == 0: 
       return self.vertices
-    yield from map(Simplex, combinations(self.vertices, len(self.vertices)-1))
+    yield from map(Simplex.from_sorted, combinations(self.vertices, len(self.vertices)-1))
 
   def dim(self) -> int: 
     return len(self.vertices)-1
@@ -118,9 +139,15 @@ class Simplex(SimplexBase): # , Generic[IT]
   A simplex is a value type object supporting set-like behavior. Simplex instances are hashable, comparable, immutable, and homogenous. 
   """
   def __init__(self, v: SimplexConvertible):
-    # t = tuple(unique_justseen(sorted(collapse(v))))
-    super(Simplex, self).__init__(v)
-    # object.__setattr__(self, 'vertices', t)
+    # super(Simplex, self).__init__(v)
+    object.__setattr__(self, 'vertices', _vertices(v))
+
+  @classmethod
+  def from_sorted(cls, vertices: tuple) -> Simplex:
+    """Constructs a simplex from a tuple of strictly increasing vertex labels, skipping all input validation."""
+    s = object.__new__(cls)
+    object.__setattr__(s, 'vertices', vertices)
+    return s
 
 @dataclass(slots=False, frozen=False, init=False, repr=False, eq=False)
 class PropertySimplex(SimplexBase):
@@ -187,9 +214,8 @@ class ValueSimplex(SimplexBase, Generic[IT]):
       value = float(value) if (hasattr(value, '__float__') and not isinstance(value, Number)) else value
       value = int(value) if (hasattr(value, '__int__') and not isinstance(value, Number)) else value
     assert isinstance(value, Number), "Value must be a number"
-    t = tuple(unique_justseen(sorted(collapse(v))))
     object.__setattr__(self, 'value', value)
-    object.__setattr__(self, 'vertices', t)
+    object.__setattr__(self, 'vertices', _vertices(v))
 
   def __repr__(self) -> str:
     idx_str = f"{self.value}" if isinstance(self.value, Integral) else f"{self.value:.2f}"
@@ -0,0 +1,189 @@
+## SimplexArray.py
+## Packed, homogeneous containers of simplices supporting vectorized face enumeration, boundaries, and face tests.
+import numpy as np
+from typing import *
+from numbers import Integral
+from itertools import combinations, chain
+from .meta import SimplexConvertible
+from .Simplex import Simplex
+from .combinatorial import rank_combs, is_wide, from_wide
+
+def _unique_rows(F: np.ndarray) -> np.ndarray:
+  """Sorts the rows of a 2-d array lexicographically and removes duplicates."""
+  if len(F) == 0:
+    return F
+  F = F[np.lexsort(F.T[::-1])]
+  return F[np.r_[True, np.any(F[1:] != F[:-1], axis=1)]]
+
+class SimplexArray:
+  """Packed array of _m_ simplices of a common dimension _p_, stored as an (m, p+1) array of sorted vertex labels.
+
+  A simplex array is the vectorized counterpart of a sequence of _Simplex_ objects: indexing with an integer returns a _Simplex_,
+  while slicing (or indexing with an array) returns another _SimplexArray_. The faces, boundary, and face relations of all
+  simplices are computed with array operations, and conversion via _np.asarray_ returns the underlying vertex array without copying.
+
+  The simplices are taken to generate a complex: _faces(p)_ and _card(p)_ refer to the distinct p-faces of all the simplices.
+
+  Attributes:
+    simplices: (m, p+1) array of vertex labels, each row sorted in increasing order.
+  """
+  def __init__(self, simplices: Union[np.ndarray, Iterable[SimplexConvertible]] = (), dtype: np.dtype = np.uint32) -> None:
+    """Constructs a simplex array from an (m, p+1) array of vertex labels or from an iterable of simplices of a common dimension.
+
+    A 1-d array is interpreted as an array of vertices (0-simplices). Rows need not be sorted, but must not repeat labels, and 
+    labels must be non-negative integers.
+    """
+    if isinstance(simplices, np.ndarray):
+      A = simplices[:,np.newaxis] if simplices.ndim == 1 else simplices
+    else:
+      S = [tuple(s) for s in simplices]
+      if len(set(map(len, S))) > 1:
+        raise ValueError("Simplices of differing dimensions cannot be stored in a simplex array.")
+      A = np.array(S).reshape(len(S), len(S[0]) if len(S) > 0 else 0)
+    assert A.ndim == 2, "Simplex arrays require an (m, p+1) array of vertex labels."
+    if A.size > 0 and not (np.issubdtype(A.dtype, np.integer) and A.min() >= 0):
+      raise ValueError("Vertex labels must be non-negative integers.")
+    A = np.sort(A.astype(dtype, copy=False), axis=1)
+    if A.shape[1] > 1 and np.any(A[:,1:] == A[:,:-1]):
+      raise ValueError("Simplices must not contain repeated vertex labels.")
+    self.simplices = A
+
+  @classmethod
+  def _from_sorted(cls, A: np.ndarray) -> 'SimplexArray':
+    """Wraps an (m, p+1) array whose rows are already strictly increasing, skipping validation."""
+    S = cls.__new__(cls)
+    S.simplices = A
+    return S
+
+  @property
+  def shape(self) -> tuple:
+    return self.simplices.shape
+
+  @property
+  def dtype(self) -> np.dtype:
+    return self.simplices.dtype
+
+  ## --- Collection requirements ---
+  def __len__(self) -> int:
+    return len(self.simplices)
+
+  def __iter__(self) -> Iterator[Simplex]:
+    return map(Simplex.from_sorted, map(tuple, self.simplices.tolist()))
+
+  def __contains__(self, item: SimplexConvertible) -> bool:
+    s = Simplex(item)
+    if len(s) != self.simplices.shape[1]:
+      return False
+    return bool(np.any(np.all(self.simplices == np.array(s.vertices, dtype=self.dtype), axis=1)))
+
+  def __getitem__(self, key: Union[int, slice, np.ndarray]) -> Union[Simplex, 'SimplexArray']:
+    if isinstance(key, Integral):
+      return Simplex.from_sorted(tuple(self.simplices[key].tolist()))
+    return SimplexArray._from_sorted(self.simplices[key])
+
+  def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> np.ndarray:
+    A = self.simplices if dtype is None else self.simplices.astype(dtype, copy=False)
+    return A.copy() if copy else A
+
+  def __repr__(self) -> str:
+    return f"SimplexArray({len(self)} {self.dim()}-simplices)"
+
+  ## --- Elementwise face relations ---
+  def _other(self, other: Union['SimplexArray', SimplexConvertible, np.ndarray]) -> np.ndarray:
+    if isinstance(other, SimplexArray):
+      return other.simplices
+    if isinstance(other, np.ndarray):
+      return np.sort(np.atleast_2d(other), axis=1)
+    return np.atleast_2d(np.array(Simplex(other).vertices, dtype=self.dtype))
+
+  @staticmethod
+  def _is_face(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Elementwise test of whether each row of _A_ is a face of the corresponding row of _B_, broadcasting single rows."""
+    m = max(len(A), len(B))
+    if A.shape[1] > B.shape[1]:
+      return np.zeros(m, dtype=bool)
+    return np.all(np.any(A[:,:,np.newaxis] == B[:,np.newaxis,:], axis=2), axis=1) & np.ones(m, dtype=bool)
+
+  def __le__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    """Elementwise face test: whether the i-th simplex is a face of the i-th simplex of _other_ (or of _other_ itself, if it's a simplex)."""
+    return SimplexArray._is_face(self.simplices, self._other(other))
+
+  def __lt__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    B = self._other(other)
+    return SimplexArray._is_face(self.simplices, B) if self.shape[1] < B.shape[1] else np.zeros(max(len(self), len(B)), dtype=bool)
+
+  def __ge__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    """Elementwise coface test: whether the i-th simplex of _other_ (or _other_ itself, if it's a simplex) is a face of the i-th simplex."""
+    return SimplexArray._is_face(self._other(other), self.simplices)
+
+  def __gt__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    B = self._other(other)
+    return SimplexArray._is_face(B, self.simplices) if B.shape[1] < self.shape[1] else np.zeros(max(len(self), len(B)), dtype=bool)
+
+  def __eq__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    B = self._other(other)
+    if B.shape[1] != self.shape[1]:
+      return np.zeros(max(len(self), len(B)), dtype=bool)
+    return np.all(self.simplices == B, axis=1)
+
+  def __ne__(self, other: Union['SimplexArray', SimplexConvertible]) -> np.ndarray:
+    return ~self.__eq__(other)
+
+  __hash__ = None
+
+  ## --- splex generics support ---
+  def dim(self) -> int:
+    return self.simplices.shape[1] - 1
+
+  def faces(self, p: Optional[int] = None, **kwargs) -> Union['SimplexArray', Iterator[Simplex]]:
+    """Returns the distinct p-faces of the simplices as a simplex array, in lexicographical order.
+
+    If _p_ is None, an iterator over the faces of every dimension is returned instead.
+    """
+    if p is None:
+      return chain.from_iterable(self.faces(q) for q in range(self.dim()+1))
+    assert isinstance(p, Integral), f"Invalid p:{p} given"
+    k = self.simplices.shape[1]
+    if p < 0 or p+1 > k:
+      return SimplexArray._from_sorted(np.empty((0, max(p+1, 0)), dtype=self.dtype))
+    if p+1 == k:
+      return SimplexArray._from_sorted(_unique_rows(self.simplices))
+    F = np.concatenate([self.simplices[:,idx] for idx in combinations(range(k), p+1)])
+    return SimplexArray._from_sorted(_unique_rows(F))
+
+  def boundary(self, p: Optional[int] = None, oriented: bool = False, **kwargs) -> Union['SimplexArray', tuple]:
+    """Returns the boundary faces of every simplex, optionally with their orientation signs.
+
+    The j-th boundary face of the i-th simplex is stored at row i*(p+1) + j, where faces are enumerated in the order of
+    _itertools.combinations_ and the j-th face is given the sign (-1)**j, matching _boundary_matrix_.
+
+    Returns:
+      F: simplex array of the m*(p+1) boundary faces.
+      signs: if _oriented_ is True, an int8 array of the sign of each face.
+    """
+    m, k = self.simplices.shape
+    if k <= 1:
+      F = np.empty((0, 0), dtype=self.dtype)
+    else:
+      F = np.stack([self.simplices[:,idx] for idx in combinations(range(k), k-1)], axis=1).reshape(m*k, k-1)
+    F = SimplexArray._from_sorted(F)
+    if not oriented:
+      return F
+    signs = np.tile((-1)**np.arange(k, dtype=np.int8), m) if k > 1 else np.empty(0, dtype=np.int8)
+    return F, signs
+
+  def card(self, p: Optional[int] = None) -> Union[tuple, int]:
+    if p is None:
+      return tuple(len(self.faces(q)) for q in range(self.dim()+1))
+    return len(self.faces(p))
+
+  def rank(self, n: Optional[int] = None, order: str = 'colex') -> np.ndarray:
+    """Ranks the simplices via the combinatorial number system, yielding one integer key per simplex.
+
+    For the 'lex' order, the number of vertices _n_ defaults to the largest vertex label plus one. If the ranks can exceed 63 bits, 
+    they are returned as exact integers in an object array.
+    """
+    n = (int(self.simplices.max()) + 1 if self.simplices.size > 0 else 0) if n is None else n
+    wide = is_wide(n, self.simplices.shape[1])
+    R = rank_combs(self.simplices, n=n, order=order, wide=wide)
+    return from_wide(R) if wide else R
@@ -9,12 +9,14 @@
 from .meta import SimplexConvertible, SimplexLike, ComplexLike, FiltrationLike, PropertySimplexConvertible
 from .generics import card, dim, faces, boundary
 from .Simplex import Simplex, ValueSimplex, PropertySimplex
+from .views import FaceView
+from .SimplexArray import SimplexArray
 from .predicates import *
 from .filters import fixed_filter, generic_filter, lower_star_filter, flag_filter
-from .sparse import boundary_matrix
+from .sparse import boundary_matrix, coboundary_matrix
 from .geometry import enclosing_radius, rips_complex, rips_filtration, delaunay_complex
 from .complexes import SetComplex, RankComplex, simplicial_complex, print_complex
-from .filtrations import SetFiltration, RankFiltration, filtration
+from .filtrations import SetFiltration, RankFiltration, filtration, merge
 
 ## Modules to expose
 ## Since Python has such terrible support for simple relative imports, we put everything in one directory
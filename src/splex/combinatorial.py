@@ -0,0 +1,225 @@
+## combinatorial.py
+## Overflow-aware ranking and unranking of combinations via the combinatorial number system.
+## The vectorized routines from _combin_ are used whenever the ranks fit in 63 bits and the labels fit in 16 bits, 
+## as _combin_ silently truncates larger labels; otherwise 64-bit arithmetic is used where it cannot overflow, and exact 
+## arbitrary-precision arithmetic on object arrays where it can. Ranks exceeding 63 bits are stored as pairs of 64-bit words.
+import numpy as np
+from typing import *
+from numbers import Integral
+from math import comb, factorial
+from combin import comb_to_rank, rank_to_comb
+
+MAX_RANK = 2**63 - 1  # largest rank representable in both signed and unsigned 64-bit storage
+MAX_LABEL = 2**16 - 1 # combin unranks into 16-bit vertex labels
+WIDE_RANK = np.dtype([('hi', '>u8'), ('lo', '>u8')]) # 128-bit ranks; big-endian words, so their bytes compare like the ranks
+
+def is_wide(n: int, k: int) -> bool:
+  """Checks whether the ranks of combinations of size at most _k_ from _n_ labels can exceed 63 bits."""
+  return any(comb(int(n), i) > MAX_RANK + 1 for i in range(1, int(k)+1))
+
+def _fits_u64(n: int, k: int) -> bool:
+  """Checks whether j * C(c, j) fits in 64 bits for all c <= _n_ and j <= _k_, i.e. whether binomial coefficients can be computed in 64 bits."""
+  return all(comb(int(n), i) * i < 2**64 for i in range(1, int(k)+1))
+
+def rank_dtype(n: int, k: int, dtype: np.dtype = np.uint64) -> np.dtype:
+  """Returns _dtype_ if all ranks of combinations of size at most _k_ from _n_ labels fit in it, otherwise the 128-bit _WIDE_RANK_ dtype."""
+  return WIDE_RANK if is_wide(n, k) else np.dtype(dtype)
+
+def min_rank_dtype(n: int, k: int) -> np.dtype:
+  """Returns the narrowest unsigned dtype holding the ranks of all combinations of size at most _k_ from _n_ labels, or _WIDE_RANK_ if none can."""
+  if is_wide(n, k):
+    return WIDE_RANK
+  max_rank = max((comb(int(n), i) for i in range(1, int(k)+1)), default=1) - 1
+  return np.min_scalar_type(max(max_rank, 0))
+
+def to_wide(R: Union[np.ndarray, Sequence[int]]) -> np.ndarray:
+  """Converts an array of exact non-negative ranks (e.g. Python integers in an object array) into _WIDE_RANK_ words."""
+  R = R if isinstance(R, np.ndarray) else np.array(R, dtype=object)
+  if R.dtype == WIDE_RANK:
+    return R
+  W = np.zeros(len(R), dtype=WIDE_RANK)
+  if R.dtype == object:
+    assert len(R) == 0 or max(R) < 2**128, "Ranks must fit in 128 bits."
+    W['hi'], W['lo'] = (R >> 64).astype(np.uint64), (R & (2**64 - 1)).astype(np.uint64)
+  else:
+    W['lo'] = R
+  return W
+
+def from_wide(W: np.ndarray) -> np.ndarray:
+  """Converts _WIDE_RANK_ words into an object array of exact ranks."""
+  return (W['hi'].astype(object) << 64) | W['lo'].astype(object)
+
+def rank_keys(R: np.ndarray) -> np.ndarray:
+  """Returns a view of an array of ranks that sorts, searches, and compares for equality like the ranks themselves.
+
+  Integer ranks are returned as-is; _WIDE_RANK_ ranks are viewed as opaque 16-byte strings. 
+  """
+  return R.view(np.dtype((np.void, 16))) if R.dtype == WIDE_RANK else R
+
+def rank_words(R: np.ndarray) -> tuple:
+  """Returns the 64-bit words of an array of ranks, least significant first, e.g. as keys for _np.lexsort_."""
+  return (R['lo'], R['hi']) if R.dtype == WIDE_RANK else (R,)
+
+def _comb(c: np.ndarray, j: int) -> np.ndarray:
+  """Exact binomial coefficients C(c, j) of an array of non-negative integers, as arbitrary-precision integers."""
+  c = np.asarray(c).astype(object)
+  out = np.ones(len(c), dtype=object)
+  for i in range(j):
+    out = out * (c - i)
+  return out // factorial(j)
+
+def rank_comb(s: Sequence[int], n: int = None, order: str = 'colex') -> int:
+  """Exactly ranks a single sorted combination."""
+  if order == 'colex':
+    return sum(comb(int(v), i+1) for i, v in enumerate(s))
+  assert n is not None, "Set cardinality 'n' must be supplied for lexicographical ranking."
+  k = len(s)
+  return comb(int(n), k) - 1 - sum(comb(int(n)-1-int(v), k-i) for i, v in enumerate(s))
+
+def rank_combs(C: np.ndarray, n: int, order: str = 'colex', wide: bool = False) -> np.ndarray:
+  """Ranks the rows of an (m, k) array of sorted k-combinations of _n_ labels.
+
+  Returns:
+    int64 array of ranks, or a _WIDE_RANK_ array of ranks if _wide_ is True. In the latter case, exact arbitrary-precision 
+    arithmetic is only used if the ranks of k-combinations can exceed 63 bits.
+  """
+  C = np.atleast_2d(C)
+  m, k = C.shape
+  if wide:
+    return to_wide(_exact_ranks(C, n, order) if is_wide(n, k) else rank_combs(C, n, order))
+  if m == 0:
+    return np.empty(0, dtype=np.int64)
+  if n <= MAX_LABEL + 1:
+    return np.asarray(comb_to_rank(np.array(C, dtype=np.int64, order='C'), order=order, n=n), dtype=np.int64)
+  return _exact_ranks(C, n, order).astype(np.int64)
+
+def _exact_ranks(C: np.ndarray, n: int, order: str = 'colex') -> np.ndarray:
+  """Ranks the rows of an (m, k) array of sorted k-combinations of _n_ labels exactly, in 64-bit arithmetic if it cannot overflow."""
+  m, k = C.shape
+  if order != 'colex':
+    return comb(int(n), k) - 1 - _exact_ranks(np.fliplr(int(n) - 1 - np.asarray(C, dtype=np.int64)), n, 'colex')
+  if _fits_u64(n, k):
+    return sum((_binom(C[:,i], i+1, np.uint64) for i in range(k)), np.zeros(m, dtype=np.uint64))
+  return sum((_comb(C[:,i], i+1) for i in range(k)), np.zeros(m, dtype=object))
+
+def rank_locator(ranks: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+  """Returns a function mapping an array of ranks to their positions in the sorted, duplicate-free array _ranks_, with -1 marking those not present.
+
+  If _ranks_ spans a range of values at most twice its length, the positions are read from a dense lookup table over that 
+  range, built once, rather than binary searched. The table takes at most 8 bytes per rank (with 32-bit entries). _WIDE_RANK_
+  ranks are always binary searched, as 16-byte keys (see _rank_keys_).
+  """
+  wide, table = ranks.dtype == WIDE_RANK, None
+  if wide:
+    ranks = rank_keys(np.ascontiguousarray(ranks))
+  elif len(ranks) > 0 and int(ranks[-1]) - int(ranks[0]) < max(2*len(ranks), 2**12):
+    lo, hi = int(ranks[0]), int(ranks[-1])
+    table = np.full(hi - lo + 1, -1, dtype=np.int32 if len(ranks) < 2**31 else np.int64)
+    table[ranks - ranks.dtype.type(lo)] = np.arange(len(ranks), dtype=table.dtype)
+  def _locate(R: np.ndarray) -> np.ndarray:
+    R = rank_keys(to_wide(R)) if wide else np.asarray(R)
+    out = np.full(len(R), -1, dtype=np.int64)
+    if len(ranks) == 0 or len(R) == 0:
+      return out
+    if table is not None and R.dtype != object:
+      R = np.asarray(R, dtype=np.int64)
+      inside = (R >= lo) & (R <= hi)
+      out[inside] = table[R[inside] - lo]
+      return out
+    j = np.searchsorted(ranks, R)
+    found = j < len(ranks)
+    found[found] = ranks[j[found]] == R[found]
+    out[found] = j[found]
+    return out
+  return _locate
+
+def locate_ranks(ranks: np.ndarray, R: np.ndarray) -> np.ndarray:
+  """Returns the positions of the ranks _R_ in the sorted, duplicate-free array _ranks_, with -1 marking those not present (see _rank_locator_)."""
+  return rank_locator(ranks)(R)
+
+def _binom(c: np.ndarray, j: int, dtype: np.dtype) -> np.ndarray:
+  """Binomial coefficients C(c, j) of an array of non-negative integers, computed in _dtype_ (which must hold j * C(c, j))."""
+  c = np.asarray(c).astype(dtype)
+  out = np.ones(len(c), dtype=dtype)
+  for i in range(j):
+    out = out * (c - i) // (i + 1) ## exact: out * (c - i) = C(c, i+1) * (i+1); entries with c < j become (and stay) 0
+  return out
+
+def facet_ranks(C: np.ndarray, n: int, order: str = 'colex') -> np.ndarray:
+  """Ranks the facets of the rows of an (m, k) array of sorted k-combinations of _n_ labels, without re-ranking them from scratch.
+
+  Writing T_i = C(c_i, i+1) for the terms of the colex rank of a row, removing c_j shifts the terms after it down one 
+  position, so the facet omitting c_j has rank sum_{i<j} T_i + sum_{i>j} C(c_i, i). Lex ranks follow by complementing the labels.
+
+  Returns:
+    (m, k) array whose j-th column holds the ranks of the facets omitting the j-th label of each row; int64, or exact 
+    integers in an object array if 64-bit arithmetic could overflow.
+  """
+  C = np.atleast_2d(C)
+  m, k = C.shape
+  if order != 'colex':
+    F = facet_ranks(np.fliplr(int(n) - 1 - np.asarray(C, dtype=np.int64)), n, 'colex')
+    return comb(int(n), k-1) - 1 - np.fliplr(F)
+  exact = is_wide(n, k) or not _fits_u64(n, k)
+  dtype = np.dtype(object) if exact else np.dtype(np.uint64)
+  if not exact and int(n) <= max(m, 2**16):
+    ## Gather from a table of C(v, i) over all labels v, which is no larger than the input
+    B = [_binom(np.arange(int(n)), i, dtype) for i in range(k+1)]
+    binom = lambda i, j: B[j][C[:,i]]
+  else:
+    binom = lambda i, j: _binom(C[:,i], j, dtype)
+  F = np.empty((m, k), dtype=dtype)
+  acc = np.zeros(m, dtype=dtype)
+  for j in range(k):          ## sum_{i<j} T_i
+    F[:,j] = acc
+    acc += binom(j, j+1)
+  acc = np.zeros(m, dtype=dtype)
+  for j in reversed(range(k)): ## sum_{i>j} C(c_i, i)
+    F[:,j] += acc
+    acc += binom(j, j)
+  return F if exact else F.astype(np.int64)
+
+def unrank_combs(R: np.ndarray, k: Union[int, np.ndarray], n: int, order: str = 'colex') -> Union[np.ndarray, list]:
+  """Unranks an array of ranks into sorted combinations of _n_ labels.
+
+  If _k_ is an integer, an (m, k) array of combinations is returned. Otherwise _k_ must give the size of every
+  combination, and a list of the combinations is returned instead. The ranks may be integers or _WIDE_RANK_ words.
+  """
+  R = np.asarray(R)
+  if not isinstance(k, Integral):
+    K, out = np.asarray(k), [None]*len(R)
+    for kk in np.unique(K):
+      ind = np.flatnonzero(K == kk)
+      for i, c in zip(ind, unrank_combs(R[ind], int(kk), n, order)):
+        out[i] = c
+    return out
+  if len(R) == 0:
+    return np.empty((0, k), dtype=np.int64)
+  if R.dtype == WIDE_RANK:
+    R = from_wide(R) if is_wide(n, k) else R['lo'].astype(np.uint64)
+  if R.dtype != object and n <= MAX_LABEL + 1:
+    return rank_to_comb(np.asarray(R, dtype=np.uint64), k=k, n=n, order=order)
+  exact = not _fits_u64(n, k)
+  R = R.astype(object) if exact else R.astype(np.uint64)
+  if order != 'colex':
+    C = unrank_combs(R.dtype.type(comb(int(n), k) - 1) - R, k, n, 'colex')
+    return np.fliplr(int(n) - 1 - C)
+
+  ## Exact colex unranking: the i-th largest label is the largest c satisfying C(c, i) <= r
+  binom = _comb if exact else lambda c, i: _binom(c, i, np.uint64)
+  C = np.empty((len(R), k), dtype=np.int64)
+  for i in range(k, 0, -1):
+    ## Estimate c using C(c, i) ~ (c - (i-1)/2)^i / i!, then correct the estimate exactly
+    c = np.floor((R.astype(np.float64) * factorial(i))**(1.0/i) + (i-1)/2).astype(np.int64)
+    c = np.clip(c, i-1, int(n)-1)
+    idx = np.arange(len(R))
+    while len(idx) > 0:
+      idx = idx[binom(c[idx], i) > R[idx]]
+      c[idx] -= 1
+    idx = np.arange(len(R))
+    while len(idx) > 0:
+      idx = idx[binom(c[idx]+1, i) <= R[idx]]
+      c[idx] += 1
+    C[:,i-1] = c
+    R = R - binom(c, i)
+  return C
@@ -21,7 +21,7 @@ class GenericFilter:
   def __call__(self, S: Union[SimplexConvertible, ArrayLike]) -> Union[float, np.ndarray]:
     if is_simplex_like(S):
       return self.filter_f(Simplex(S))
-    elif hasattr(S, "__array__") and is_complex_like(S):
+    elif is_array_convertible(S) and is_complex_like(S):
       S = np.asarray(S)
       return np.array([self.filter_f(s) for s in map(Simplex, S)])
     else:
@@ -55,7 +55,8 @@ class HirolaFilter:
     dims = np.array([dim(s) for s in S], dtype=np.uint8)
     for d in range(dim(S)+1):
       d_dtype = np.uint32
-      d_simplices = np.array(list(map(Simplex, faces(S,d)))).astype(d_dtype)
+      d_faces = faces(S,d)
+      d_simplices = np.asarray(d_faces, dtype=d_dtype) if is_array_convertible(d_faces) else np.array(list(map(Simplex, d_faces))).astype(d_dtype)
       d_ids = np.ravel(lookup_table[d]['table'].add(d_simplices))
       lookup_table[d]['values'][d_ids] = values[dims == d]
 
@@ -68,7 +69,7 @@ class HirolaFilter:
       T = self.table[dim(S)]
       result = T['values'][T['table'][Simplex(S)]]
       return np.take(result, 0) if dim(S) == 0 else result
-    elif hasattr(S, "__array__") and is_complex_like(S):
+    elif is_array_convertible(S) and is_complex_like(S):
       S = np.array(S, dtype=np.uint32)
       T = self.table[S.shape[1]-1]
       return np.ravel(T['values'][T['table'][S]])
@@ -95,7 +96,7 @@ class VertexFilter:
       return np.array([])
     if is_simplex_like(S):
       return np.max(self.vertex_weights[Simplex(S)]) # Simplices can be used for indexing!
-    elif hasattr(S, "__array__") and is_complex_like(S):
+    elif is_array_convertible(S) and is_complex_like(S):
       S = np.asarray(S)
       return np.max(self.vertex_weights[S], axis=-1) ## vectorized form
     else:
@@ -112,7 +113,7 @@ class CliqueFilter:
     object.__setattr__(self, 'vertex_weights', v)
     object.__setattr__(self, 'edge_weights', pd)
   def __call__(self, s: Union[SimplexConvertible, ArrayLike]) -> Union[float, np.ndarray]:
-    if hasattr(s, "__array__") and is_complex_like(s):
+    if is_array_convertible(s) and is_complex_like(s):
       ## Handles numpy matrices of simplices OR array_convertible containers, so long as they are complex-like
       s = np.asarray(s)
       if s.ndim == 1 or (1 in s.shape):
@@ -17,4 +17,12 @@ def filtration(simplices: Iterable[SimplexConvertible], f: Optional[Callable] =
     sf = RankFiltration(simplices, f, **kwargs)
   else: 
     raise ValueError(f"Unknown data structure '{str(type(form))}'.")
-  return sf
\ No newline at end of file
+  return sf
+
+def merge(F1: FiltrationLike, F2: FiltrationLike, policy: str = 'min') -> FiltrationLike:
+  """Merges two filtrations of the same type, resolving simplices in both by their 'min', 'max', or 'first' value.
+  
+  See _RankFiltration.merge_ and _SetFiltration.merge_ for details. 
+  """
+  assert type(F1) == type(F2) and hasattr(F1, "merge"), "Can only merge two RankFiltrations or two SetFiltrations."
+  return F1.merge(F2, policy=policy)
\ No newline at end of file
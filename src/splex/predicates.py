@@ -36,7 +36,8 @@ def is_filtration_like(x: Any) -> bool:
 	return False
 
 def is_array_convertible(x: Any) -> bool:
-	return hasattr(x, "__array__")
+	"""Checks whether _x_ supports conversion to a homogeneous array (face views of mixed dimension do not)."""
+	return hasattr(x, "__array__") and getattr(x, "dense", True)
 
 def is_distance_matrix(x: ArrayLike) -> bool:
 	"""Checks whether _x_ is a distance matrix, i.e. is square, symmetric, and that the diagonal is all 0."""
@@ -1,11 +1,17 @@
 import numpy as np 
 from numpy.typing import ArrayLike
-from scipy.sparse import coo_array, spmatrix
+from scipy.sparse import coo_array, csc_array, spmatrix
 from collections.abc import Sized
 from array import array
 from .generics import *
 from .predicates import *
 from .Simplex import Simplex
+from .storage import create_csc, load_csc
+from .SimplexArray import SimplexArray
+from .SetComplex import SetComplex
+from .SetFiltration import SetFiltration
+from .RankComplex import RankComplex
+from .RankFiltration import RankFiltration
 
 from more_itertools import flatten, collapse, chunked, unique_everseen 
 
@@ -45,7 +51,7 @@ def _fast_boundary(S: Iterable[SimplexConvertible], F: Iterable[SimplexConvertib
     ind = np.arange(d).astype(int)
     I = np.empty(m*d, dtype=S_arr.dtype)
     J = np.empty(m*d, dtype=S_arr.dtype)
-    X = np.empty(m*d, dtype=int)
+    X = np.empty(m*d, dtype=np.int8)
     CI = np.fromiter(range(m), dtype=int).astype(S_arr.dtype)
 
     ## Column-wise assignnment
@@ -62,20 +68,65 @@ def _fast_boundary(S: Iterable[SimplexConvertible], F: Iterable[SimplexConvertib
     return D
 
 
-## Builds a boundary matrix from the sequence of simplices in the given order
-def _full_boundary(S: Iterable[SimplexConvertible]):
-  m = 0
-  I,J,X = [],[],[] # row, col, data 
-  face_dict = { s : i for i,s in enumerate(S) }
-  for (j,s) in enumerate(S):
-    if dim(s) > 0:
-      # I.extend([F.index(f) for f in faces(s, dim(s)-1)]) ## TODO: this is painfully slow
-      I.extend([face_dict[f] for f in faces(s, dim(s)-1)])
-      J.extend(repeat(j, dim(s)+1))
-      X.extend(islice(cycle([1,-1]), dim(s)+1))
-    m += 1
-  D = coo_array((X, (I,J)), shape=(len(S), m)).tolil(copy=False)
-  return D 
+def _face_array(K: Union[ComplexLike, FiltrationLike], p: int) -> Union[np.ndarray, list]:
+  """Returns the p-faces of _K_ as a dense (m, p+1) array when possible, otherwise as a list of simplices."""
+  F = faces(K, p=p)
+  return np.asarray(F) if is_array_convertible(F) else list(map(Simplex, F))
+
+def _dims(K: Union[ComplexLike, FiltrationLike]) -> np.ndarray:
+  """Returns the dimension of every simplex of _K_, in the order _K_ enumerates them (or its faces, for simplex arrays)."""
+  S = getattr(K, 'simplices', None)
+  if S is not None and getattr(S, 'dtype', None) is not None and S.dtype.names is not None and 'dim' in S.dtype.names:
+    return np.asarray(S['dim'], dtype=np.int64)
+  if isinstance(K, SimplexArray):
+    return np.repeat(np.arange(K.dim()+1, dtype=np.int64), K.card())
+  if is_filtration_like(K):
+    return np.fromiter((len(s) for i,s in iter(K)), dtype=np.int64) - 1
+  return np.fromiter(map(len, iter(K)), dtype=np.int64) - 1
+
+def _coefficients(X: np.ndarray, field: Optional[int] = None, dtype: Optional[np.dtype] = None) -> np.ndarray:
+  """Converts an array of +/-1 signs into boundary coefficients over the integers (_field_ = None) or the integers mod _field_.
+
+  By default, integer coefficients are stored as _int_, coefficients mod 2 as booleans (i.e. only the sparsity pattern), and 
+  coefficients mod p > 2 in the narrowest unsigned dtype holding p-1, with -1 stored as p-1.
+  """
+  if field is None:
+    return X.astype(int if dtype is None else dtype, copy=False)
+  assert isinstance(field, Integral) and field >= 2, f"Invalid field characteristic '{field}' given."
+  dtype = (np.dtype(bool) if field == 2 else np.min_scalar_type(field-1)) if dtype is None else np.dtype(dtype)
+  out = np.ones(len(X), dtype=dtype)
+  if field > 2:
+    out[X < 0] = field - 1
+  return out
+
+## Builds the full boundary matrix from the per-dimension boundary blocks, in the order K enumerates its simplices
+def _full_boundary(K: Union[ComplexLike, FiltrationLike, Sequence[Simplex]], field: Optional[int] = None, dtype: Optional[np.dtype] = None) -> spmatrix:
+  if isinstance(K, list): 
+    d = np.fromiter(map(len, K), dtype=np.int64) - 1
+    face_array = lambda p: np.array([K[i].vertices for i in np.flatnonzero(d == p)], dtype=np.uint32).reshape(-1, p+1)
+  else:
+    d = _dims(K)
+    face_array = lambda p: _face_array(K, p)
+  N = len(d)
+  I, J, X = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int8)]
+  pos, F_prev = np.flatnonzero(d == 0), None
+  for p in range(1, (d.max() + 1) if N > 0 else 0):
+    pos_prev, pos = pos, np.flatnonzero(d == p)
+    if len(pos) == 0 or len(pos_prev) == 0:
+      F_prev = None
+      continue
+    if hasattr(K, '_boundary_entries'):
+      r, c, x = K._boundary_entries(p)
+    else:
+      F_prev = face_array(p-1) if F_prev is None else F_prev
+      F = face_array(p)
+      D = _fast_boundary(F, F_prev, dtype=(np.uint32, p+1))
+      r, c, x, F_prev = D.row, D.col, D.data, F
+    I.append(pos_prev[r.astype(np.int64)])
+    J.append(pos[c.astype(np.int64)])
+    X.append(x)
+  I, J, X = np.concatenate(I), np.concatenate(J), _coefficients(np.concatenate(X), field, dtype)
+  return csc_array((X, (I, J)), shape=(N, N))
 
 ## TODO: investigate whether to make a 'ChainLike' for extension with 'BoundaryChain'?
 ## Or maybe its fine to just rely on something with __index__
@@ -88,32 +139,144 @@ def _full_boundary(S: Iterable[SimplexConvertible]):
 ##    def index(SimplexConvertible) -> int 
 ## something like chain(s: SimplexLike, c: ComplexLike, oriented: bool) -> ndarray, or generator (index, value)
 ## complexLike could be overloaded to handle .index(), checked if Sequence[SimplexLike] or if just Container[int] (+implying)
-def boundary_matrix(K: Union[ComplexLike, FiltrationLike], p: Optional[Union[int, tuple]] = None):
+def boundary_matrix(K: Union[ComplexLike, FiltrationLike], p: Optional[Union[int, tuple]] = None, field: Optional[int] = None, dtype: Optional[np.dtype] = None):
   """
   Constructs a sparse boundary matrix of a given simplicial object _K_
 
   Parameters: 
     K: simplicial complex (optionally filtered) or ComplexLike. 
     p: dimension of the p-chains to form the columns. 
+    field: optional modulus p of the coefficients, e.g. 2 or 3. If None (default), the coefficients are the signs +/- 1. 
+    dtype: dtype of the coefficients. Defaults to _int_ if _field_ is None, to _bool_ (the sparsity pattern) if _field_ is 2, 
+      and to the narrowest unsigned integer type holding _field_ - 1 otherwise. 
   
   Returns: 
-    D: sparse matrix representing either the full or p-th boundary matrix (as List-of-Lists format)
+    D: sparse matrix representing either the full (in CSC format) or p-th (in COO format) boundary matrix
   """
   if isinstance(p, tuple):
-    return (boundary_matrix(K, pi) for pi in p)
+    return (boundary_matrix(K, pi, field=field, dtype=dtype) for pi in p)
   else: 
     assert p is None or isinstance(p, Integral), "p must be non-negative integer, or None"
     assert isinstance(K, ComplexLike) or isinstance(K, FiltrationLike), f"Unknown input type '{type(K)}'"
     if p is None:
-      simplices = [Simplex(s) for i,s in K] if is_filtration_like(K) else list(map(Simplex, iter(K)))# to ensure repeatable
-      D = _full_boundary(simplices)
+      if isinstance(K, (SimplexArray, SetComplex, SetFiltration, RankComplex, RankFiltration)):
+        D = _full_boundary(K, field, dtype)
+      else:
+        D = _full_boundary([Simplex(s) for i,s in K] if is_filtration_like(K) else list(map(Simplex, iter(K))), field, dtype)
+    elif hasattr(K, '_boundary_entries'):
+      I, J, X = K._boundary_entries(p)
+      D = coo_array((_coefficients(X, field, dtype), (I, J)), shape=(card(K, p-1), card(K, p)))
     else:
-      p_simplices = list(map(Simplex, faces(K, p=p)))
-      p_faces = list(map(Simplex, faces(K, p=p-1)))
+      p_simplices, p_faces = _face_array(K, p), _face_array(K, p-1)
       D = _fast_boundary(p_simplices, p_faces, dtype=(np.uint32, p+1))
+      D = coo_array((_coefficients(D.data, field, dtype), (D.row, D.col)), shape=D.shape)
     return D
 
+def _boundary_entry_chunks(K: Union[ComplexLike, FiltrationLike], p: int, chunk_size: int) -> Iterator[tuple]:
+  """Yields the row indices, column indices, and signs of the p-th boundary matrix of _K_, at most _chunk_size_ columns at a time."""
+  if hasattr(K, '_boundary_chunks'):
+    yield from K._boundary_chunks(p, chunk_size)
+    return
+  from hirola import HashTable
+  F_prev, F, k = _face_array(K, p-1), faces(K, p), p+1
+  if p <= 0 or len(F_prev) == 0:
+    return
+  F_prev = np.sort(np.asarray([tuple(f) for f in F_prev] if isinstance(F_prev, list) else F_prev, dtype=np.uint32), axis=1)
+  h = HashTable(max(len(F_prev)*1.25, 16) + 16, dtype=(F_prev.dtype, p) if p > 1 else F_prev.dtype)
+  h.add(F_prev if p > 1 else np.ravel(F_prev))
+  if hasattr(F, '__getitem__') and hasattr(F, '__len__') and is_array_convertible(F):
+    blocks = (np.asarray(F[i:i+chunk_size]) for i in range(0, len(F), chunk_size))
+  else:
+    blocks = (np.array([tuple(s) for s in c]) for c in chunked(F, chunk_size))
+  col = 0
+  for B in blocks:
+    B = np.sort(B.astype(np.uint32).reshape(-1, k), axis=1)
+    I = np.column_stack([np.ravel(h[B[:,idx] if p > 1 else B[:,idx[0]]]) for idx in combinations(range(k), k-1)]).ravel()
+    assert np.all(I >= 0), "Complex is missing faces of some of its simplices."
+    yield I, col + np.repeat(np.arange(len(B)), k), np.tile((-1)**np.arange(k, dtype=np.int8), len(B))
+    col += len(B)
+
+def boundary_chunks(K: Union[ComplexLike, FiltrationLike], p: int, chunk_size: int = 2**16, field: Optional[int] = None, dtype: Optional[np.dtype] = None) -> Iterator[tuple]:
+  """Yields the p-th boundary matrix of _K_ as consecutive blocks of at most _chunk_size_ columns.
+
+  Only one block is held in memory at a time (along with an index over the (p-1)-faces of _K_), so column reductions and 
+  out-of-core writers can consume the matrix chunk by chunk. The coefficients are determined by _field_ and _dtype_ as in _boundary_matrix_.
+
+  Yields: 
+    j: the index of the first column of the block. 
+    B: (card(p-1), c) CSC matrix of the columns [j, j+c), with sorted row indices. 
+  """
+  assert isinstance(p, Integral), "p must be an integer"
+  n, k = card(K, p-1), p+1
+  for I, J, X in _boundary_entry_chunks(K, p, int(chunk_size)):
+    c = len(I) // k
+    I, X = I.reshape(c, k), X.reshape(c, k)
+    ind = np.argsort(I, axis=1)
+    I, X = np.take_along_axis(I, ind, axis=1).ravel(), np.take_along_axis(X, ind, axis=1).ravel()
+    yield int(J[0]), csc_array((_coefficients(X, field, dtype), I, np.arange(c+1)*k), shape=(n, c))
+
+def write_boundary_matrix(K: Union[ComplexLike, FiltrationLike], p: int, path: str, chunk_size: int = 2**16, field: Optional[int] = None, dtype: Optional[np.dtype] = None) -> spmatrix:
+  """Writes the p-th boundary matrix of _K_ to memory-mapped CSC arrays in the directory _path_, _chunk_size_ columns at a time.
+
+  Peak memory is bounded by the chunk size (plus an index over the (p-1)-faces of _K_), rather than by the size of the matrix. 
+  The coefficients are determined by _field_ and _dtype_ as in _boundary_matrix_, except that signs (_field_ = None) default 
+  to 8-bit integers. The matrix can be re-opened later with _splex.storage.load_csc_.
+
+  Returns: 
+    (card(p-1), card(p)) CSC matrix backed by the memory-mapped arrays.
+  """
+  assert isinstance(p, Integral), "p must be an integer"
+  n, m, k = card(K, p-1), card(K, p), p+1
+  nnz = m*k if p > 0 and n > 0 else 0
+  index_dtype = np.int32 if max(n, m, nnz) < 2**31 else np.int64
+  dtype = np.int8 if field is None and dtype is None else dtype
+  data_dtype = _coefficients(np.empty(0, dtype=np.int8), field, dtype).dtype
+  indptr, indices, data = create_csc(path, shape=(n, m), nnz=nnz, index_dtype=index_dtype, data_dtype=data_dtype)
+  for j in range(0, m+1, chunk_size):
+    indptr[j:j+chunk_size] = np.arange(j, min(j+chunk_size, m+1)) * (k if nnz > 0 else 0)
+  for j, B in boundary_chunks(K, p, chunk_size, field=field, dtype=dtype):
+    c = B.shape[1]
+    indices[j*k:(j+c)*k] = B.indices
+    data[j*k:(j+c)*k] = B.data
+  for arr in (indptr, indices, data):
+    arr.flush()
+  del indptr, indices, data
+  return load_csc(path)
+
+def anti_transpose(D: spmatrix, format: str = 'coo', copy: bool = True) -> spmatrix:
+  """Anti-transposes a sparse matrix, i.e. transposes it about its anti-diagonal, using index arithmetic on its COO arrays.
+
+  Entry (i, j) of an (n, m) matrix _D_ is moved to (m-1-j, n-1-i). If _copy_ is False and _D_ is in COO format, its index 
+  arrays are overwritten in place and shared by the result.
+  """
+  assert format in ['coo', 'csc', 'csr'], f"Invalid format '{format}' given."
+  n, m = D.shape
+  D = D.tocoo(copy=False) if D.format != 'coo' else D
+  row, col = (D.row.copy(), D.col.copy()) if copy else (D.row, D.col)
+  np.subtract(m-1, col, out=col)
+  np.subtract(n-1, row, out=row)
+  A = coo_array((D.data.copy() if copy else D.data, (col, row)), shape=(m, n), copy=False)
+  return A if format == 'coo' else A.asformat(format)
+
 ## It's enough to just manipulate the row, col, indices of a coo array from the boundary matrix
-def coboundary_matrix():
-  pass 
-  # D1.shape[1]-np.flip(D1.col)-1, D1.shape[0]-np.flip(D1.row)-1
\ No newline at end of file
+def coboundary_matrix(K: Union[ComplexLike, FiltrationLike], p: Optional[int] = None, D: Optional[spmatrix] = None, format: str = 'csc', copy: bool = True, field: Optional[int] = None, dtype: Optional[np.dtype] = None) -> spmatrix:
+  """
+  Constructs the anti-transposed coboundary matrix of a given simplicial object _K_
+
+  The coboundary matrix is the transpose of the boundary matrix with its rows and columns in reverse (filtration) order, 
+  which is the layout reducing its columns computes persistent cohomology in. 
+
+  Parameters: 
+    K: simplicial complex (optionally filtered) or ComplexLike. 
+    p: dimension of the p-chains forming the columns of the corresponding boundary matrix, or None for the full matrix. 
+    D: optional boundary matrix of _K_ (as given by _boundary_matrix(K, p)_) to reuse instead of recomputing it. 
+    format: sparse format of the output, one of 'csc', 'csr', or 'coo'. 
+    copy: whether to copy the index arrays of _D_. If False, the COO index arrays of _D_ are overwritten in place. 
+    field, dtype: coefficients of the boundary matrix, as in _boundary_matrix_; ignored if _D_ is given. 
+
+  Returns: 
+    sparse (card(p), card(p-1)) matrix whose (i, j)-th entry is the (card(p-1)-1-j, card(p)-1-i)-th entry of the boundary matrix.
+  """
+  if D is None:
+    D, copy = boundary_matrix(K, p, field=field, dtype=dtype), False
+  return anti_transpose(D, format=format, copy=copy)
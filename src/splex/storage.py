@@ -0,0 +1,126 @@
+## storage.py
+## Storage layouts and binary (de)serialization of the structured arrays backing the rank-based complexes and filtrations.
+## Files consist of a small JSON header followed by the raw array data, aligned so that the latter can be memory-mapped.
+import os
+import json
+import struct
+import numpy as np
+from typing import *
+from numbers import Integral
+
+MAGIC = b"SPLEX\x01"
+ALIGN = 64
+
+def save_array(path: str, arr: np.ndarray, **header) -> None:
+  """Writes a 1-d structured array to _path_ along with the JSON-serializable metadata in _header_."""
+  data = np.ascontiguousarray(arr)
+  header = dict(header, dtype=np.lib.format.dtype_to_descr(arr.dtype), shape=len(arr))
+  h = json.dumps(header).encode("utf-8")
+  h_len = -(-(len(MAGIC) + 4 + len(h)) // ALIGN) * ALIGN
+  with open(path, "wb") as fh:
+    fh.write(MAGIC)
+    fh.write(struct.pack("<I", h_len))
+    fh.write(h.ljust(h_len - len(MAGIC) - 4, b" "))
+    data.tofile(fh)
+
+def load_array(path: str, mmap_mode: Optional[str] = 'r') -> tuple[np.ndarray, dict]:
+  """Reads a structured array and its header written by _save_array_.
+
+  If _mmap_mode_ is not None, the array is returned as a _np.memmap_ with the given mode; otherwise it is read into memory.
+  """
+  with open(path, "rb") as fh:
+    if fh.read(len(MAGIC)) != MAGIC:
+      raise ValueError(f"File '{path}' is not a splex array file.")
+    h_len = struct.unpack("<I", fh.read(4))[0]
+    header = json.loads(fh.read(h_len - len(MAGIC) - 4).decode("utf-8"))
+  dtype = np.lib.format.descr_to_dtype([tuple(field) for field in header['dtype']])
+  shape = (header['shape'],)
+  if mmap_mode is not None and shape[0] > 0:
+    data = np.memmap(path, dtype=dtype, mode=mmap_mode, offset=h_len, shape=shape)
+  else:
+    data = np.fromfile(path, dtype=dtype, offset=h_len, count=shape[0])
+  return data, header
+
+def create_csc(path: str, shape: tuple, nnz: int, index_dtype: np.dtype = np.int64, data_dtype: np.dtype = np.int8) -> tuple:
+  """Creates a directory of memory-mapped arrays holding an (n, m) sparse matrix with _nnz_ nonzeros in CSC format.
+
+  Returns:
+    writeable memory-mapped _indptr_, _indices_, and _data_ arrays, to be filled in and flushed by the caller.
+  """
+  os.makedirs(path, exist_ok=True)
+  with open(os.path.join(path, "header.json"), "w") as fh:
+    json.dump(dict(format='csc', shape=[int(shape[0]), int(shape[1])], nnz=int(nnz)), fh)
+  open_memmap = lambda name, dtype, size: np.lib.format.open_memmap(os.path.join(path, name + ".npy"), mode='w+', dtype=dtype, shape=(size,))
+  return open_memmap("indptr", index_dtype, int(shape[1]) + 1), open_memmap("indices", index_dtype, int(nnz)), open_memmap("data", data_dtype, int(nnz))
+
+def load_csc(path: str, mmap_mode: Optional[str] = 'r') -> 'csc_array':
+  """Loads a sparse matrix written with _create_csc_ as a _csc_array_ whose index and data arrays are memory-mapped with _mmap_mode_."""
+  from scipy.sparse import csc_array
+  with open(os.path.join(path, "header.json"), "r") as fh:
+    header = json.load(fh)
+  indptr, indices, data = (np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode) for name in ["indptr", "indices", "data"])
+  return csc_array((data, indices, indptr), shape=tuple(header['shape']), copy=False)
+
+class ColumnArray:
+  """Struct-of-arrays counterpart of a 1-d structured array. 
+
+  Each field is stored as its own contiguous array, so that sorts and reductions over a single field do not go through strided views. 
+  Supports the subset of the structured array interface used by the rank-based classes: field access and assignment by name, 
+  row selection by integer, slice, or index array, _len_, _dtype_, _copy_, _setflags_, and conversion to a structured array. 
+  """
+  def __init__(self, columns: dict) -> None:
+    self.columns = columns
+
+  @classmethod
+  def empty(cls, m: int, dtype: np.dtype) -> 'ColumnArray':
+    dtype = np.dtype(dtype)
+    return cls({ name : np.empty(m, dtype=dtype[name]) for name in dtype.names })
+
+  @classmethod
+  def from_records(cls, arr: np.ndarray) -> 'ColumnArray':
+    return cls({ name : np.ascontiguousarray(arr[name]) for name in arr.dtype.names })
+
+  @property
+  def dtype(self) -> np.dtype:
+    return np.dtype([(name, col.dtype) for name, col in self.columns.items()])
+
+  @property
+  def nbytes(self) -> int:
+    return sum(col.nbytes for col in self.columns.values())
+
+  def __len__(self) -> int:
+    return len(next(iter(self.columns.values()))) if len(self.columns) > 0 else 0
+
+  def __getitem__(self, key: Union[str, int, slice, np.ndarray]) -> Union[np.ndarray, 'ColumnArray']:
+    if isinstance(key, str):
+      return self.columns[key]
+    if isinstance(key, Integral):
+      return tuple(col[key] for col in self.columns.values())
+    return ColumnArray({ name : col[key] for name, col in self.columns.items() })
+
+  def __setitem__(self, key: Union[str, int, slice, np.ndarray], value: Any) -> None:
+    if isinstance(key, str):
+      self.columns[key][...] = value
+    else:
+      value = value if isinstance(value, (ColumnArray, np.ndarray)) else np.array(value, dtype=self.dtype)
+      for name, col in self.columns.items():
+        col[key] = value[name]
+
+  def copy(self) -> 'ColumnArray':
+    return ColumnArray({ name : col.copy() for name, col in self.columns.items() })
+
+  def setflags(self, write: Optional[bool] = None) -> None:
+    for col in self.columns.values():
+      col.setflags(write=write)
+
+  def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> np.ndarray:
+    arr = np.empty(len(self), dtype=self.dtype)
+    for name, col in self.columns.items():
+      arr[name] = col
+    return arr if dtype is None else arr.astype(dtype)
+
+  def __eq__(self, other: Any) -> np.ndarray:
+    return np.asarray(self) == np.asarray(other)
+
+  def __repr__(self) -> str:
+    return f"ColumnArray({len(self)}, dtype={self.dtype})"
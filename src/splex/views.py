@@ -0,0 +1,142 @@
+## views.py
+## Sized, indexable views over the faces of simplicial objects.
+import numpy as np
+from typing import *
+from numbers import Integral
+from collections.abc import Sequence
+from .meta import SimplexConvertible
+from .Simplex import Simplex
+from .combinatorial import rank_comb, unrank_combs, rank_keys, to_wide, WIDE_RANK
+
+class FaceView(Sequence):
+  """Sized, indexable, lazily-iterable view of the faces of a simplicial object.
+
+  A view is backed by either:
+    - an (m, p+1) array of vertex labels, which _np.asarray_ returns without copying
+    - an array of combinatorial ranks, which are unranked on demand (in chunks, when iterating)
+    - a sequence of simplex-like objects, restricted to a range or array of positions
+
+  Indexing with an integer returns a single simplex, whereas slicing (or indexing with an array) returns
+  another view over the same backend. Converting a view to an array yields the dense (m, p+1) array of
+  vertex labels; for views which are not array-backed, it is cached for subsequent conversions.
+  """
+  chunk_size: int = 2**16
+
+  def __init__(self, faces: Union[np.ndarray, Sequence] = (), p: Optional[int] = None, index: Optional[Union[range, np.ndarray]] = None) -> None:
+    """Constructs a view over a dense array of faces or over a sequence of simplex-like objects.
+
+    Parameters:
+      faces: (m, p+1) integer array, or a sequence of simplex-like objects.
+      p: dimension of the faces, if they are known to share one. Inferred from _faces_ if it's an array.
+      index: optional range or integer array of positions of _faces_ to restrict the view to. Only used for sequences.
+    """
+    self._ranks, self._k, self._n, self._order, self._dense = None, None, 0, 'colex', None
+    if isinstance(faces, np.ndarray):
+      assert faces.ndim == 2 or len(faces) == 0, "Array-backed views require an (m, p+1) array of faces."
+      self._array = faces if faces.ndim == 2 else np.empty((0, 0 if p is None else p+1), dtype=np.int64)
+      self._faces, self._index = None, None
+      self._p = self._array.shape[1] - 1 if self._array.ndim == 2 and len(self._array) > 0 else p
+    else:
+      self._array, self._faces, self._p = None, faces, p
+      self._index = range(len(faces)) if index is None else index
+
+  @classmethod
+  def from_ranks(cls, ranks: np.ndarray, k: Union[int, np.ndarray], n: int, order: str = 'colex') -> 'FaceView':
+    """Constructs a view over combinatorial ranks of faces of _n_ vertices, of size _k_ (per-face or shared)."""
+    view = cls()
+    if not isinstance(k, Integral):
+      k = np.asarray(k)
+      if len(k) > 0 and np.all(k == k[0]):
+        k = int(k[0])
+    view._faces, view._index = None, None
+    view._ranks, view._k, view._n, view._order = ranks, k, int(n), order
+    view._p = k - 1 if isinstance(k, Integral) else None
+    return view
+
+  def _unrank(self, key: Union[slice, np.ndarray]) -> Union[np.ndarray, list]:
+    k = self._k if isinstance(self._k, Integral) else self._k[key]
+    return unrank_combs(self._ranks[key], k=k, n=self._n, order=self._order)
+
+  @property
+  def dense(self) -> bool:
+    """Whether the faces are known to share a dimension, i.e. whether the view converts to an (m, p+1) array."""
+    return self._p is not None or self._array is not None or self._dense is not None
+
+  def __len__(self) -> int:
+    if self._array is not None:
+      return len(self._array)
+    return len(self._ranks) if self._ranks is not None else len(self._index)
+
+  def __getitem__(self, key: Union[int, slice, np.ndarray]) -> Union[SimplexConvertible, 'FaceView']:
+    if isinstance(key, Integral):
+      key = int(key) + len(self) if key < 0 else int(key)
+      if key < 0 or key >= len(self):
+        raise IndexError("face index out of range")
+      if self._array is not None:
+        return Simplex(self._array[key])
+      elif self._ranks is not None:
+        return Simplex(self._unrank(slice(key, key+1))[0])
+      return self._faces[self._index[key]]
+    if not isinstance(key, slice):
+      key = np.asarray(key)
+      key = np.flatnonzero(key) if key.dtype == bool else key
+    if self._array is not None:
+      return FaceView(self._array[key], p=self._p)
+    elif self._ranks is not None:
+      k = self._k if isinstance(self._k, Integral) else self._k[key]
+      return FaceView.from_ranks(self._ranks[key], k=k, n=self._n, order=self._order)
+    index = self._index[key] if isinstance(key, slice) else np.asarray(self._index)[key]
+    return FaceView(self._faces, p=self._p, index=index)
+
+  def __iter__(self) -> Iterator[SimplexConvertible]:
+    if self._array is not None:
+      yield from map(Simplex, self._array.tolist())
+    elif self._dense is not None:
+      yield from map(Simplex, self._dense.tolist())
+    elif self._ranks is not None:
+      for i in range(0, len(self._ranks), self.chunk_size):
+        C = self._unrank(slice(i, i+self.chunk_size))
+        yield from map(Simplex, C.tolist() if isinstance(C, np.ndarray) else C)
+    else:
+      yield from (self._faces[i] for i in self._index)
+
+  def __contains__(self, item: SimplexConvertible) -> bool:
+    s = Simplex(item)
+    if self._p is not None and len(s) != self._p + 1:
+      return False
+    if self._array is not None:
+      return bool(np.any(np.all(self._array == np.array(s, dtype=self._array.dtype), axis=1)))
+    elif self._ranks is not None:
+      if len(s) == 0 or max(s) >= self._n:
+        return False
+      R, r = self._ranks, rank_comb(s, n=self._n, order=self._order)
+      if R.dtype == WIDE_RANK:
+        R, r = rank_keys(R), rank_keys(to_wide([r]))[0]
+      same_size = R == r
+      return bool(np.any(same_size if isinstance(self._k, Integral) else same_size & (self._k == len(s))))
+    return any(s == Simplex(f) for f in self)
+
+  def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> np.ndarray:
+    if self._array is not None:
+      A = self._array
+    elif self._dense is not None:
+      A = self._dense
+    else:
+      if len(self) == 0:
+        A = np.empty((0, 0 if self._p is None else max(self._p+1, 0)), dtype=np.int64)
+      elif self._ranks is not None and isinstance(self._k, Integral):
+        A = self._unrank(slice(None))
+      elif self._ranks is not None:
+        raise ValueError("Faces of differing dimensions cannot be converted to a dense array.")
+      else:
+        F = [tuple(f) for f in self]
+        if len(set(map(len, F))) > 1:
+          raise ValueError("Faces of differing dimensions cannot be converted to a dense array.")
+        A = np.array(F, dtype=np.int64)
+      self._dense = A
+    A = A if dtype is None else A.astype(dtype, copy=False)
+    return A.copy() if copy else A
+
+  def __repr__(self) -> str:
+    p_str = "" if self._p is None else f"{self._p}-"
+    return f"FaceView({len(self)} {p_str}faces)"
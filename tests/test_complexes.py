@@ -48,7 +48,7 @@ def test_rank_complex():
   S.add([0,1,2,3])
   assert check_poset(S)
   assert card(S) == (4,6,4,1)
-  # assert list(S.cofaces([0,1,2])) == [(0,1,2), (0,1,2,3)]
+  assert list(S.cofaces([0,1,2])) == [(0,1,2), (0,1,2,3)]
   S.remove([0,1,2,3])
   assert [0,1,2,3] not in S
   # assert S.remove([[0,1,2,3]]) == KeyError
@@ -59,7 +59,7 @@ def test_rank_complex():
   assert len(list(S.cofaces([0,1]))) == 0
   #assert np.all(np.array(S) == S.simplices), "Array conversion doesn't work"
   assert card(S) == (4,5,2)
-  assert format(S) == '0 1 0 2 1 0 3 0 1 1 2\n    2   2 2   3 2 3 3\n          3     3    '
+  assert format(S) == '0 1 2 3 0 1 0 1 2 0 1\n        2 2 3 3 3 2 2\n                  3 3'
   assert np.all(faces(S, 1) == np.array([[0,2],[1,2],[0,3],[1,3],[2,3]], np.uint16))
 
 def test_bulk_insertion():
@@ -72,3 +72,131 @@ def test_bulk_insertion():
   S3 = SimplexTree(map(Simplex, triangles))
   assert card(S1) == card(S2) and card(S2) == card(S3)
 
+
+def test_rank_complex_from_array():
+  import pytest
+  np.random.seed(1234)
+  triangles = np.random.choice(range(50), replace=True, size=(100,3))
+  S1 = RankComplex.from_array(triangles)
+  S2 = RankComplex(list(map(Simplex, triangles)))
+  assert np.all(S1.simplices == S2.simplices)
+  assert card(S1) == card(SetComplex(triangles))
+  assert card(RankComplex.from_array(np.array([[0,0,1]]))) == (2,1)
+  with pytest.raises(ValueError):
+    RankComplex.from_array(np.array([[-1,2,3]]))
+
+def test_rank_complex_contains():
+  S = RankComplex([[0,1,2], [1,2,3], [2,3,4]])
+  assert np.all(np.diff(S.simplices['dim'].astype(int)) >= 0), "Simplices not sorted by dimension"
+  assert all(s in S for s in faces(SetComplex([[0,1,2], [1,2,3], [2,3,4]])))
+  assert [0,4] not in S and [0,1,2,3] not in S and [5] not in S
+  Q = np.array([[0,1],[0,4],[3,4],[2,3],[1,4],[5,6]])
+  assert np.all(S.contains_many(Q) == np.array([True, False, True, True, False, False]))
+  assert np.all(S.contains_many([0,4,5]) == np.array([True, True, False]))
+  assert len(S.contains_many(np.empty((0,3), dtype=int))) == 0
+  assert np.all(S.contains_many(np.array([[-1,2],[1,2]])) == np.array([False, True]))
+
+def test_rank_complex_update():
+  import pytest
+  np.random.seed(1234)
+  triangles = np.random.choice(range(40), replace=True, size=(60,3))
+  S1, S2 = RankComplex(), SetComplex()
+  for chunk in np.array_split(triangles, 6):
+    S1.update(chunk)
+    S2.update(chunk)
+    assert card(S1) == card(S2)
+  S1.update([[0,1,2,3], [41], (5,7)])
+  S2.update([[0,1,2,3], [41], (5,7)])
+  assert card(S1) == card(S2)
+  assert np.all(S1.simplices == RankComplex(faces(S2)).simplices)
+  for X in [[[-1,2]], np.array([[-1,2]])]:
+    with pytest.raises(ValueError):
+      RankComplex(X)
+    with pytest.raises(ValueError):
+      S1.update(X)
+  assert card(S1) == card(S2)
+
+def test_rank_complex_cofaces():
+  np.random.seed(1234)
+  triangles = np.random.choice(range(30), replace=True, size=(80,4))
+  S1, S2 = RankComplex(triangles), SetComplex(triangles)
+  for s in [[0], [3,7], list(S2[40]), [29], [100]]:
+    assert sorted(S1.cofaces(s), key=lambda s: (len(s), tuple(s))) == list(S2.cofaces(s))
+    S1.discard(s)
+    S2.discard(s)
+    assert card(S1) == card(S2) and s not in S1
+  try:
+    S1.remove([0])
+    assert False, "Removing a missing simplex should raise"
+  except KeyError:
+    pass
+  S1.update([[0,1,2]])
+  S2.update([[0,1,2]])
+  assert sorted(S1.cofaces([0]), key=lambda s: (len(s), tuple(s))) == list(S2.cofaces([0]))
+  from splex.RankComplex import _searchsorted
+  A = np.zeros(5000, dtype=[('rank', np.uint64), ('dim', np.uint8)])
+  A['rank'] = np.sort(np.random.choice(20000, size=5000))
+  v = np.r_[np.sort(np.random.choice(20100, size=50)), A['rank'][[0,-1]], A['rank'][-1]+1].astype(np.uint64)
+  assert np.all(_searchsorted(A['rank'], v) == np.searchsorted(np.array(A['rank']), v))
+
+def test_rank_complex_wide(tmp_path):
+  np.random.seed(1234)
+  T = np.sort(np.random.choice(range(400000), size=(25,4)), axis=1)
+  S1, S2 = RankComplex(T[:,:3]), SetComplex(T)
+  assert not S1.wide
+  S1.update(T)
+  assert S1.wide, "Ranks of tetrahedra on 400K vertices should not fit in 64 bits"
+  assert not S1.simplices.dtype.hasobject and S1.simplices.dtype['rank'].names == ('hi', 'lo')
+  assert card(S1) == card(S2)
+  assert all(s in S1 for s in S2) and [0,1,2,3] not in S1
+  assert np.all(S1.contains_many(T))
+  assert sorted(map(Simplex, S1), key=lambda s: (len(s), tuple(s))) == list(S2)
+  S1.discard(T[0,:2])
+  S2.discard(T[0,:2])
+  assert card(S1) == card(S2)
+  assert sorted(map(tuple, S1.cofaces(T[1,:1]))) == sorted(map(tuple, S2.cofaces(T[1,:1])))
+  S1.save(tmp_path / "wide.splex")
+  S_mm = RankComplex.load(tmp_path / "wide.splex")
+  assert isinstance(S_mm.simplices, np.memmap) and S_mm.wide and card(S_mm) == card(S1)
+  assert all(s in S_mm for s in S2) and np.all(S_mm.contains_many(T[1:]))
+
+def test_rank_complex_save_load(tmp_path):
+  np.random.seed(1234)
+  S = RankComplex(np.random.choice(range(30), size=(40,3)))
+  S.save(tmp_path / "complex.splex")
+  S_mm = RankComplex.load(tmp_path / "complex.splex")
+  assert isinstance(S_mm.simplices, np.memmap)
+  assert np.all(S_mm.simplices == S.simplices) and card(S_mm) == card(S)
+  assert all(s in S_mm for s in S)
+  S_mm.add([100, 101])
+  assert [100, 101] in S_mm and [100, 101] not in RankComplex.load(tmp_path / "complex.splex", mmap_mode=None)
+
+def test_face_view():
+  S = RankComplex([[0,1,2],[1,2,3],[3,4]])
+  F = faces(S, 1)
+  assert isinstance(F, FaceView) and len(F) == card(S, 1)
+  assert np.all(np.asarray(F) == np.array([[0,1],[0,2],[1,2],[1,3],[2,3],[3,4]]))
+  assert F[0] == Simplex([0,1]) and F[-1] == Simplex([3,4]) and list(F[1:3]) == [Simplex([0,2]), Simplex([1,2])]
+  assert [1,3] in F and [0,3] not in F and [0,1,2] not in F
+  assert np.asarray(faces(S, 5)).shape == (0, 6)
+  assert list(faces(S)) == list(S) and len(faces(S)) == len(S)
+  T = SetComplex(S)
+  assert np.all(np.asarray(faces(T, 1)) == np.asarray(F)) and list(faces(T, 2)) == list(faces(S, 2))
+  A = np.array([[0,1],[2,3]])
+  assert np.asarray(FaceView(A)) is A and FaceView(A)[1] == Simplex([2,3])
+
+def test_set_complex_stars():
+  import pytest
+  S = SetComplex([[0,1,2,3],[2,3,4],[4,5]])
+  assert list(S.cofaces([2,3])) == list(map(Simplex, [[2,3],[0,2,3],[1,2,3],[2,3,4],[0,1,2,3]]))
+  assert list(S.cofaces([0,4])) == [] and list(S.cofaces([9])) == [] and len(list(S.cofaces([]))) == len(S)
+  S.remove([2,3])
+  assert card(S) == (6,8,2) and [2,3] not in S and [0,1,2] in S and all(len(list(S.cofaces([v]))) > 0 for v in range(6))
+  S.discard([5])
+  assert card(S) == (5,7,2) and 5 not in S.stars
+  S.discard([0,1,2])
+  S.discard([0,1,3])
+  S.discard([3,4])
+  assert card(S) == (5,6) and set(S.stars[3]) == set(map(Simplex, [[3],[0,3],[1,3]]))
+  with pytest.raises(ValueError):
+    S.remove([0,1,2])
@@ -73,3 +73,189 @@ def test_set_filtration():
   # K.clear()
   
 
+
+def test_rank_filtration_wide(tmp_path):
+  np.random.seed(1234)
+  T = np.sort(np.random.choice(range(400000), size=(10,4)), axis=1)
+  S = SetComplex(T)
+  K1, K2 = RankFiltration(S, f=lambda s: max(s)), SetFiltration(S, f=lambda s: max(s))
+  assert K1.wide and card(K1) == card(K2)
+  assert all(Simplex(s1) == Simplex(s2) for s1, s2 in zip(faces(K1), faces(K2)))
+  for order in ['lex', 'reverse lex', 'colex']:
+    K1.order = order
+    assert all(s in K1 for s in S)
+  s0, s5 = K1[0][1], K1[5][1]
+  K1.update_values(np.array([0, 5]), [-1, 10**6])
+  assert K1[0] == (-1, s0) and K1[len(K1)-1] == (10**6, s5) and np.all(np.diff(K1.simplices['value']) >= 0)
+  K1.save(tmp_path / "wide.splex")
+  K_mm = RankFiltration.load(tmp_path / "wide.splex")
+  assert isinstance(K_mm.simplices, np.memmap) and K_mm.wide and [tuple(s) for s in faces(K_mm)] == [tuple(s) for s in faces(K1)]
+
+def test_rank_filtration_save_load(tmp_path):
+  K = RankFiltration(SetComplex([[0,1,2],[2,3],[4]]), f=lambda s: max(s))
+  K.order = 'reverse lex'
+  K.save(tmp_path / "filtration.splex")
+  K_mm = RankFiltration.load(tmp_path / "filtration.splex")
+  assert isinstance(K_mm.simplices, np.memmap) and K_mm.order == 'reverse lex'
+  assert np.all(K.simplices == K_mm.simplices) and [tuple(s) for s in faces(K)] == [tuple(s) for s in faces(K_mm)]
+  K_mem = RankFiltration.load(tmp_path / "filtration.splex", mmap_mode=None)
+  assert not isinstance(K_mem.simplices, np.memmap) and np.all(K.simplices == K_mem.simplices)
+
+def test_rank_filtration_metadata():
+  K = RankFiltration(SetComplex([[0,1,2],[2,3],[5]]), f=lambda s: max(s))
+  assert K.n_vertices == 6 and K.n_simplices == (5,4,1) and list(K.offsets) == [0,5,9,10]
+  assert card(K) == (5,4,1) and card(K,1) == 4 and card(K,3) == 0 and dim(K) == 2
+  K.order = 'lex'
+  assert K.n_vertices == 6 and K.n_simplices == (5,4,1)
+  assert [2,3] in K and [0,1,2] in K and [4] not in K and [6] not in K and [0,1,2,3] not in K
+
+def test_rank_filtration_from_arrays():
+  import pytest
+  S = RankComplex([[0,1,2],[1,2,3],[3,4]])
+  f = lambda s: max(s) + 0.5*(len(s)-1)
+  K1 = RankFiltration(S, f=f)
+  K2 = RankFiltration.from_arrays({ p: (np.asarray(faces(S,p)), [f(s) for s in faces(S,p)]) for p in range(dim(S)+1) })
+  K3 = RankFiltration.from_arrays({ p: np.asarray(faces(S,p)) for p in range(dim(S)+1) }, f=lambda P: P.max(axis=1) + 0.5*(P.shape[1]-1))
+  assert np.all(K1.simplices == K2.simplices) and np.all(K1.simplices == K3.simplices)
+  assert K3.n_simplices == card(S) and K3.n_vertices == 5
+  assert len(RankFiltration.from_arrays({})) == 0
+  with pytest.raises(ValueError):
+    RankFiltration.from_arrays({ 0: np.array([[0],[1]]) })
+
+def test_rank_filtration_order_conversion():
+  from splex.combinatorial import rank_comb
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K = RankFiltration(S, f=lambda s: max(s))
+  colex = K.simplices.copy()
+  K.order = 'lex'
+  assert all(r == rank_comb(s, n=6, order='lex') for r, s in zip(K.simplices['rank'], faces(K)))
+  K.order = 'colex'
+  assert np.all(K.simplices == colex)
+
+def test_rank_filtration_index():
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K = RankFiltration(S, f=lambda s: max(s))
+  for order in ['colex', 'reverse lex']:
+    K.order = order
+    positions = [K.index(s) for v, s in K]
+    assert positions == list(range(len(K)))
+    assert np.all(K.index_many(np.asarray(faces(K, 1))) == np.flatnonzero(K.simplices['dim'] == 1))
+    assert list(K.index_many([[0,1], [0,5], [2,3,4], [9], [1,1]])) == [K.index([0,1]), -1, K.index([2,3,4]), -1, -1]
+    assert K.index([0,4]) == -1 and K.index([6]) == -1 and [0,4] not in K and [3,4] in K
+
+def test_rank_filtration_update_values():
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  f = lambda s: max(s)
+  for order in ['colex', 'reverse lex']:
+    K = RankFiltration(S, f=f)
+    K.order = order
+    K.update_values([[4],[3,4],[2,3,4]], [0.5, 0.5, 7])
+    K.update_values(np.array([0, 1]), 2.5)
+    expected = K.simplices.copy()
+    K.reindex()
+    assert np.all(K.simplices == expected)
+    assert K.index([2,3,4]) == len(K) - 1 and all(K.index(s) == i for i, (v, s) in enumerate(K))
+  np.random.seed(1234)
+  S = RankComplex.from_array(np.random.choice(30, size=(100,3)))
+  for order, layout in [('colex', 'records'), ('reverse lex', 'columns')]:
+    K = RankFiltration(S, f=lambda s: float(np.random.randint(4)), layout=layout)
+    K.order = order
+    for m in [1, 10, len(K) // 2]:
+      K.update_values(np.random.choice(len(K), m, replace=False), np.random.randint(5, size=m))
+      expected = np.array(K.simplices)
+      K.reindex()
+      assert np.all(np.array(K.simplices) == expected)
+
+def test_rank_filtration_sublevel():
+  import pytest
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K = RankFiltration(S, f=lambda s: max(s))
+  K2 = K.sublevel(3)
+  assert np.shares_memory(K2.simplices, K.simplices) and not K2.simplices.flags.writeable
+  assert card(K2) == (4,6,4,1) and dim(K2) == 3 and [0,1,2,3] in K2 and [3,4] not in K2
+  assert K2.n_vertices == K.n_vertices and np.all(np.asarray(faces(K2, 1)) == np.asarray(faces(K, 1))[:6])
+  D2 = boundary_matrix(K2, 2).todense()
+  assert D2.shape == (6, 4) and np.all(np.abs(D2).sum(axis=0) == 3)
+  assert len(K.sublevel(-1)) == 0 and card(K.sublevel(-1)) == ()
+  B = K.between(4, 4)
+  assert np.all(B.indices() == 4) and len(B) == len(K.sublevel(4)) - len(K2) and len(K.between(6, 1)) == 0
+  with pytest.raises(ValueError):
+    boundary_matrix(K.between(4, 5), 2)
+
+def test_rank_filtration_views_copy_on_write(tmp_path):
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  for layout in ['records', 'columns']:
+    K = RankFiltration(S, f=lambda s: max(s), layout=layout)
+    V = K.sublevel(3)
+    records, F2 = np.array(V.simplices), list(faces(V, 2))
+    K.order = 'lex'
+    K.update_values([[0],[1]], 2.5)
+    K.reindex(lambda F: [-len(s) for s in F])
+    assert np.all(np.array(V.simplices) == records) and list(faces(V, 2)) == F2
+  K = RankFiltration(S, f=lambda s: max(s))
+  K.save(tmp_path / "K.splex")
+  for mmap_mode in ['r', 'r+']:
+    L = RankFiltration.load(tmp_path / "K.splex", mmap_mode=mmap_mode)
+    L.order = 'lex'
+    L.update_values(np.array([0]), -1.0)
+    L.reindex(lambda F: [len(s) for s in F])
+    assert np.all(np.array(RankFiltration.load(tmp_path / "K.splex").simplices) == K.simplices)
+
+def test_rank_filtration_layout(tmp_path):
+  S = RankComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K1 = RankFiltration(S, f=lambda s: max(s))
+  K2 = RankFiltration(S, f=lambda s: max(s), layout='columns')
+  K3 = RankFiltration.from_arrays({ p: np.asarray(faces(S,p)) for p in range(4) }, f=lambda P: P.max(axis=1), value_dtype=np.float32, layout='columns')
+  assert K1.simplices.dtype == np.dtype([('rank', np.uint8), ('dim', np.uint8), ('value', np.float64)])
+  assert K1.simplices.itemsize == 10 and K3.simplices.nbytes == 6*len(K3)
+  for K in [K2, K3]:
+    assert np.all(K.simplices == K1.simplices) and K.simplices['rank'].flags.c_contiguous
+  for K in [K1, K2]:
+    K.order = 'reverse lex'
+    K.update_values([[4],[3,4]], 0.5)
+  assert np.all(K1.simplices == K2.simplices) and K2.index([3,4]) == K1.index([3,4])
+  assert card(K2.sublevel(3)) == card(K1.sublevel(3))
+  assert np.all(boundary_matrix(K2, 2).todense() == boundary_matrix(K1, 2).todense())
+  K2.save(tmp_path / "columns.splex")
+  assert np.all(RankFiltration.load(tmp_path / "columns.splex").simplices == K1.simplices)
+
+def test_merge_filtrations():
+  S1, S2 = SetComplex([[0,1,2],[2,3]]), SetComplex([[2,3,4],[1,2],[5]])
+  f1, f2 = lambda s: max(s), lambda s: 6 - min(s)
+  union = SetComplex(list(S1) + list(S2))
+  for policy, g in [('min', min), ('max', max), ('first', lambda a, b: a)]:
+    v = lambda s: g(f1(s), f2(s)) if (s in S1 and s in S2) else (f1(s) if s in S1 else f2(s))
+    for order in ['colex', 'reverse lex']:
+      K1, K2, K = RankFiltration(S1, f=f1), RankFiltration(S2, f=f2), RankFiltration(union, f=v)
+      K1.order, K2.order, K.order = order, order, order
+      M = merge(K1, K2, policy=policy)
+      assert np.all(M.simplices == K.simplices) and M.n_simplices == K.n_simplices and M.n_vertices == 6
+    M = merge(SetFiltration(S1, f=f1), SetFiltration(S2, f=f2), policy=policy)
+    assert dict((s, i) for i, s in M) == { Simplex(s) : v(s) for s in union }
+    assert list(M.indices()) == sorted(M.indices())
+    assert list(M.copy()) == list(M) and M.copy().card() == M.card()
+
+def test_set_filtration_buckets():
+  S = SetComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K = SetFiltration(S, f=lambda s: max(s))
+  for p in range(4):
+    assert list(faces(K, p)) == [s for s in K.data if len(s) == p+1] and card(K, p) == card(S, p)
+    assert list(K.indices(p)) == [s.value for s in faces(K, p)]
+  assert len(faces(K, 4)) == 0 and card(K, 4) == 0
+  K.discard([2,3])
+  assert card(K) == tuple(len(b) for b in K.buckets) == (6,8,2) and [2,3] not in K
+  K.discard([0])
+  assert card(K) == tuple(len(b) for b in K.buckets) == (5,5) and list(faces(K, 1)) == [s for s in K.data if len(s) == 2]
+  assert boundary_matrix(K, 1).shape == (5, 5)
+
+def test_set_filtration_update():
+  K = SetFiltration([(5, [0,1,2]), (1, [0]), (3, [1,3])])
+  assert dict((tuple(s), v) for v, s in K) == {(0,): 1, (1,): 3, (2,): 5, (3,): 3, (0,1): 5, (0,2): 5, (1,2): 5, (0,1,2): 5, (1,3): 3}
+  assert card(K) == tuple(len(b) for b in K.buckets) == (4,4,1)
+  K.update([(0, [0,1]), (7, [2,3])])
+  assert dict((tuple(s), v) for v, s in K)[(0,1)] == 5 and card(K) == (4,5,1)
+  assert dict((tuple(s), v) for v, s in SetFiltration([(1, [0,1]), (5, [0])]))[(0,)] == 1
+  assert dict((tuple(s), v) for v, s in SetFiltration([(1, [0]), (3, [0])]))[(0,)] == 1
+  S = SetComplex([[0,1,2,3],[2,3,4],[4,5]])
+  K1 = SetFiltration(S, f=lambda s: max(s))
+  assert list(K1.copy()) == list(K1) and K1.copy().card() == K1.card()
@@ -1,5 +1,6 @@
 from splex import * 
 from splex.meta import _data_attributes 
+from splex.combinatorial import rank_comb
 
 def test_simplex():
   s = Simplex([0,1,2])
@@ -22,6 +23,14 @@ def test_simplex():
   assert s - t == Simplex(2)
   assert hash(s) is not None
 
+def test_simplex_construction():
+  inputs = [(2,0,1,1), [2,0,1], np.array([2,0,1,0], dtype=np.uint8), [[0,1],2], Simplex([0,1,2]), ValueSimplex([0,1,2], 1), range(3)]
+  for v in inputs:
+    assert Simplex(v).vertices == (0,1,2) and all(isinstance(i, int) for i in Simplex(v))
+  assert Simplex(5).vertices == (5,) and Simplex([]).vertices == ()
+  assert Simplex.from_sorted((0,1,2)) == Simplex([0,1,2]) and isinstance(Simplex.from_sorted((0,1,2)), Simplex)
+  assert all(type(f) is Simplex for f in ValueSimplex([0,1,2], 1).faces())
+
 def test_simplex_varieties():
   s = Simplex([0,1,2])
   f = ValueSimplex([0,1,2], 1)
@@ -55,4 +64,26 @@ def test_filter_weight():
   assert np.all(f(faces(S)) == np.array([1,1,1,1]))
 
 
-  
\ No newline at end of file
+  
+def test_simplex_array():
+  import pytest
+  S = SimplexArray([[2,1,0],[1,2,3],[3,4,5]])
+  assert dim(S) == 2 and len(S) == 3 and card(S) == (6,8,3) and card(S, 1) == 8
+  assert S[0] == Simplex([0,1,2]) and isinstance(S[1:], SimplexArray) and [1,2,3] in S and [0,1,3] not in S
+  assert np.asarray(S).dtype == np.uint32 and np.all(np.asarray(S) == [[0,1,2],[1,2,3],[3,4,5]])
+  K = SetComplex(S)
+  for p in range(3):
+    assert [tuple(f) for f in faces(S, p)] == sorted(tuple(f) for f in faces(K, p))
+  F, signs = boundary(S, oriented=True)
+  assert len(F) == 9 and list(F[:3]) == list(Simplex([0,1,2]).boundary()) and list(signs[:3]) == [1,-1,1]
+  assert np.all(F <= S[np.repeat(np.arange(3), 3)]) and np.all(S[np.repeat(np.arange(3), 3)] > F)
+  assert list(faces(S, 1) <= Simplex([0,1,2])) == [True, True, True] + [False]*5
+  assert list(S >= [1,2]) == [True, True, False] and not np.any(S < S) and np.all(S == S)
+  assert list(S.rank()) == [rank_comb(s) for s in S]
+  assert boundary_matrix(S, 2).shape == (8, 3)
+  T = SimplexArray([[1,2,3],[0,1,2],[0,1,2]])
+  assert card(T) == (4,5,2) and len(faces(T, 2)) == 2 and boundary_matrix(T).shape == (11, 11)
+  for X in [np.array([[-1,2]]), np.array([[0.5,2.0]]), [[-1,2]]]:
+    with pytest.raises(ValueError):
+      SimplexArray(X)
+  assert len(SimplexArray([])) == 0 and SimplexArray(np.array([[2,1]], dtype=np.int64)).dtype == np.uint32
@@ -81,3 +81,95 @@ def test_boundary_medium():
 #   assert np.all(col_counts == 3)
 #   sgn_vals = D.tocsc().data
 #   assert np.allclose(np.tile([1,-1,1], sx.card(SR,2)), sgn_vals)
+
+def test_boundary_full_blocks():
+  from simplextree import SimplexTree
+  S = sx.simplicial_complex([[0,1,2,3], [2,3,4], [4,5]], form="rank")
+  K = sx.RankFiltration(S, f=lambda s: -len(s))
+  K.order = 'reverse colex'
+  for X in [S, K, sx.SetFiltration(K), list(sx.faces(S)), SimplexTree([[0,1,2,3], [2,3,4], [4,5]])]:
+    D = sx.boundary_matrix(X)
+    assert D.format == "csc" and D.shape == (len(S), len(S))
+    simplices = [sx.Simplex(s) for i,s in X] if sx.is_filtration_like(X) else list(map(sx.Simplex, X))
+    index = { s : i for i,s in enumerate(simplices) }
+    for j, s in enumerate(simplices):
+      col = D[:,[j]].toarray().ravel()
+      expected = np.zeros(len(S))
+      for i, f in enumerate(s.boundary() if len(s) > 1 else []):
+        expected[index[f]] = (-1)**i
+      assert np.all(col == expected)
+
+def test_coboundary():
+  X = np.random.uniform(size=(12,2))
+  K = sx.rips_filtration(X, p=2)
+  for p in [1, 2, None]:
+    D = sx.boundary_matrix(K, p).toarray()
+    C = sx.coboundary_matrix(K, p)
+    assert C.format == "csc" and np.all(C.toarray() == D[::-1,::-1].T)
+  D = sx.boundary_matrix(K, 2)
+  C = sx.coboundary_matrix(K, 2, D=D, format="csr")
+  assert C.format == "csr" and np.all(C.toarray() == sx.boundary_matrix(K, 2).toarray()[::-1,::-1].T)
+  C = sx.coboundary_matrix(K, 2, D=D, format="coo", copy=False)
+  assert np.shares_memory(C.col, D.row) and np.all(C.toarray() == sx.boundary_matrix(K, 2).toarray()[::-1,::-1].T)
+
+def test_boundary_rank_native():
+  from splex.combinatorial import facet_ranks, rank_comb
+  from splex.sparse import _fast_boundary, _face_array
+  C = np.array([[0,2,5,7],[1,3,4,9]])
+  for order in ['colex', 'lex']:
+    expected = [[rank_comb(np.delete(c, j), n=10, order=order) for j in range(4)] for c in C]
+    assert np.all(facet_ranks(C, n=10, order=order) == expected)
+  X = np.random.uniform(size=(15,2))
+  K = sx.rips_filtration(X, p=3)
+  S = sx.simplicial_complex(sx.faces(K), form="rank")
+  for order in ['colex', 'lex', 'reverse colex', 'reverse lex']:
+    K.order = order
+    for Y in [K, S]:
+      for p in range(0, 5):
+        D = sx.boundary_matrix(Y, p)
+        E = _fast_boundary(_face_array(Y, p), _face_array(Y, p-1), dtype=(np.uint32, p+1))
+        assert D.shape == E.shape and np.all(D.toarray() == E.toarray())
+
+def test_boundary_chunked(tmp_path):
+  from splex.sparse import boundary_chunks, write_boundary_matrix
+  from splex.storage import load_csc
+  X = np.random.uniform(size=(12,2))
+  K = sx.rips_filtration(X, p=2)
+  K.order = 'reverse lex'
+  S = sx.simplicial_complex(sx.faces(K), form="set")
+  for Y in [K, sx.simplicial_complex(S, form="rank"), S, sx.SetFiltration(K)]:
+    for p in range(0, 4):
+      D = sx.boundary_matrix(Y, p).toarray()
+      B = [(j, C) for j, C in boundary_chunks(Y, p, chunk_size=7)]
+      assert all(C.shape[1] <= 7 and C.has_sorted_indices for j, C in B)
+      assert sum(C.shape[1] for j, C in B) == (sx.card(Y, p) if p > 0 else 0)
+      M = write_boundary_matrix(Y, p, str(tmp_path / f"D{p}"), chunk_size=7)
+      assert isinstance(M.indices, np.ndarray) and M.shape == D.shape and np.all(M.toarray() == D)
+      assert np.all(load_csc(str(tmp_path / f"D{p}")).toarray() == D)
+
+def test_rank_locator():
+  from splex.combinatorial import rank_locator
+  for ranks in [np.arange(10, 20000, 3, dtype=np.uint32), np.array([0, 5, 10**12], dtype=np.uint64)]:
+    locate = rank_locator(ranks)
+    R = np.r_[ranks[::-1], ranks + 1, 0]
+    assert np.all(locate(R) == np.r_[np.arange(len(ranks))[::-1], [-1]*len(ranks), 0 if ranks[0] == 0 else -1])
+
+def test_boundary_field(tmp_path):
+  from splex.sparse import write_boundary_matrix
+  X = np.random.uniform(size=(12,2))
+  K = sx.rips_filtration(X, p=2)
+  S = sx.simplicial_complex(sx.faces(K), form="set")
+  for Y in [K, S]:
+    for p in [1, 2, None]:
+      D = sx.boundary_matrix(Y, p)
+      assert D.dtype == int
+      D2, D3 = sx.boundary_matrix(Y, p, field=2), sx.boundary_matrix(Y, p, field=3)
+      assert D2.dtype == bool and np.all(D2.toarray() == (D.toarray() != 0))
+      assert D3.dtype == np.uint8 and np.all(D3.toarray() == np.mod(D.toarray(), 3))
+      D7 = sx.boundary_matrix(Y, p, field=7, dtype=np.int16)
+      assert D7.dtype == np.int16 and np.all(D7.toarray() == np.mod(D.toarray(), 7))
+      assert sx.boundary_matrix(Y, p, dtype=np.int8).dtype == np.int8
+  C = sx.coboundary_matrix(K, 2, field=3)
+  assert C.dtype == np.uint8 and np.all(C.toarray() == np.mod(sx.boundary_matrix(K, 2).toarray()[::-1,::-1].T, 3))
+  M = write_boundary_matrix(K, 2, str(tmp_path / "D2"), field=2)
+  assert M.dtype == bool and np.all(M.toarray() == sx.boundary_matrix(K, 2, field=2).toarray())